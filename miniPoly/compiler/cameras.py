@@ -154,7 +154,8 @@ class AbstractCameraCompiler(StreamingCompiler):
             self.set_state(buffer_name, frame)
             self.set_streaming_buffer(buffer_name, frame)
         else:
-            self.create_shared_buffer(buffer_name, frame)  # create a buffer for sharing only
+            # 'latest' (item 32): the capture loop never waits on a preview reader's copy
+            self.create_shared_buffer(buffer_name, frame, mode='latest')  # create a buffer for sharing only
             self.create_streaming_buffer(buffer_name, frame, saving_opt=self.save_option, shared=False) # create a buffer for streaming to local disk only
         self._buffer_name = buffer_name
 
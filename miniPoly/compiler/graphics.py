@@ -162,7 +162,9 @@ class ShaderStreamer(app.Canvas, StreamingCompiler):
         self._fbo = gloo.FrameBuffer(color=self._rendertex, depth=gloo.RenderBuffer(self._max_frame_shape))
         self._frame_delta = time()
 
-        self.create_shared_buffer(_contract.APP_FBO_PREVIEW, np.zeros((*self._max_frame_shape, 3), dtype=np.uint8))
+        # 'latest' (item 32): written every draw, read by a GUI that only wants the newest
+        self.create_shared_buffer(_contract.APP_FBO_PREVIEW, np.zeros((*self._max_frame_shape, 3), dtype=np.uint8),
+                                  mode='latest')
 
 
         # Protocol execution related params
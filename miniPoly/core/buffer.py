@@ -1,8 +1,11 @@
 import atomics as _atomics
 import json
 import numpy as np
+import struct as _struct
 import traceback
 import warnings
+import zlib as _zlib
+from json.encoder import encode_basestring_ascii as _encode_basestring_ascii
 from multiprocessing import shared_memory, Lock
 from time import sleep
 
@@ -57,6 +60,128 @@ def _encode(data):
     return _ENCODER.encode(data).encode('utf-8')
 
 
+#: One key directory slot (item 31): crc32 of the JSON-encoded key, that key's encoded
+#: length, and the offset and length of its value inside the payload. Offsets are
+#: relative to the payload start, so the directory does not depend on the header layout.
+#: A value never encodes to zero bytes, so `value_len == 0` marks an empty slot.
+_DIRECTORY_SLOT = _struct.Struct('<4I')
+_DIRECTORY_COUNT = _struct.Struct('<I')
+
+
+#: Value types whose JSON text never contains the `', '` item separator, so a whole run
+#: of them can be encoded by one call on a list and split back apart.
+_SPLITTABLE_TYPES = (int, float, bool, type(None))
+#: Per key tuple: the text before each value, and the directory with the key-side
+#: columns filled in. Keys repeat from one write to the next; value lengths do not.
+_KEY_LAYOUTS = {}
+_KEY_LAYOUT_LIMIT = 64
+#: Below this many keys the directory is filled in a plain loop; numpy's per-call
+#: overhead only pays for itself on larger dicts (7 us against 14 us at 10 keys).
+_VECTORIZE_FROM = 64
+
+
+def _key_layout(keys):
+    """The value-independent half of a directory, built once per key set (item 31)."""
+    layout = _KEY_LAYOUTS.get(keys)
+    if layout is not None:
+        return layout
+    if len(_KEY_LAYOUTS) >= _KEY_LAYOUT_LIMIT:
+        _KEY_LAYOUTS.clear()
+    n_slots = 2
+    while n_slots < 2 * len(keys):
+        n_slots *= 2
+    mask = n_slots - 1
+    prefixes = []
+    slots = np.zeros((n_slots, 4), dtype='<u4')
+    rows = np.empty(len(keys), dtype=np.intp)
+    occupied = [False] * n_slots
+    for i, key in enumerate(keys):
+        encoded_key = _encode_basestring_ascii(key)
+        prefixes.append(('{' if i == 0 else ', ') + encoded_key + ': ')
+        key_hash = _zlib.crc32(encoded_key.encode('ascii'))
+        slot = key_hash & mask
+        while occupied[slot]:
+            slot = (slot + 1) & mask
+        occupied[slot] = True
+        slots[slot, 0:2] = key_hash, len(encoded_key)
+        rows[i] = slot
+    if len(keys) < _VECTORIZE_FROM:
+        layout = (prefixes, [len(p) for p in prefixes], slots.ravel().tolist(), rows.tolist(),
+                  _struct.Struct(f'<{slots.size}I'))
+    else:
+        layout = (prefixes, np.fromiter(map(len, prefixes), dtype=np.int64, count=len(keys)), slots, rows,
+                  None)
+    _KEY_LAYOUTS[keys] = layout
+    return layout
+
+
+def _encode_indexed(data):
+    """Encode a dict as `_encode` would, plus a key directory for single-key reads (item 31).
+
+    The payload is assembled from per-item text joined with the separators `json.dumps`
+    uses, so it is byte-identical to `_encode(data)` and every reader that decodes the
+    whole blob is unaffected. Assembling it by hand is what makes each value's position
+    known without a second pass over the bytes.
+
+    The directory is an open-addressed table, a power of two at least twice the key
+    count, probed linearly from `crc32(key) & mask`. Keys stay arbitrary runtime strings
+    -- nothing about the namespace is declared in advance -- and a lookup costs the same
+    however many other keys the dict holds.
+
+    Encoding every value separately measured six times the cost of one `_encode` at
+    1000 keys, nearly all of it per-call encoder overhead. So numbers, bools and None go
+    through the encoder as one list and are split back on `', '`, which their JSON text
+    cannot contain; strings go through the same C escape function the encoder itself
+    uses; only containers and foreign types are encoded one by one. Everything the
+    encoder emits is ASCII (`ensure_ascii` is on), so text lengths are byte lengths.
+
+    Returns `(payload, directory)`. The directory is empty when the data is not a dict
+    with string keys; json would coerce other key types, and then the encoded key a
+    reader looks up would not be the one written.
+    """
+    if not isinstance(data, dict) or not all(type(k) is str for k in data):
+        return _encode(data), b''
+    if not data:
+        return b'{}', _DIRECTORY_COUNT.pack(2) + bytes(2 * _DIRECTORY_SLOT.size)
+    prefixes, prefix_lengths, slots, rows, packer = _key_layout(tuple(data))
+
+    values = list(data.values())
+    encoded = [None] * len(values)
+    batch_rows, batch = [], []
+    for i, value in enumerate(values):
+        value_type = type(value)
+        if value_type is str:
+            encoded[i] = _encode_basestring_ascii(value)
+        elif value_type in _SPLITTABLE_TYPES:
+            batch_rows.append(i)
+            batch.append(value)
+        else:
+            encoded[i] = _ENCODER.encode(value)
+    if batch:
+        for i, text in zip(batch_rows, _ENCODER.encode(batch)[1:-1].split(', ')):
+            encoded[i] = text
+
+    parts = [None] * (2 * len(values))
+    parts[0::2] = prefixes
+    parts[1::2] = encoded
+    payload = (''.join(parts) + '}').encode('ascii')
+
+    if packer is not None:
+        directory = slots.copy()
+        offset = 0
+        for row, prefix_length, text in zip(rows, prefix_lengths, encoded):
+            offset += prefix_length
+            directory[4 * row + 2] = offset
+            directory[4 * row + 3] = len(text)
+            offset += len(text)
+        return payload, _DIRECTORY_COUNT.pack(len(slots) // 4) + packer.pack(*directory)
+    value_lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    directory = slots.copy()
+    directory[rows, 2] = np.cumsum(prefix_lengths + value_lengths) - value_lengths
+    directory[rows, 3] = value_lengths
+    return payload, _DIRECTORY_COUNT.pack(len(slots)) + directory.tobytes()
+
+
 class SharedBuffer:
     """
     The SharedBuffer class allows for the sharing of data with dynamic size and structure between processes.
@@ -70,8 +195,11 @@ class SharedBuffer:
 
         [0 : _READ_OFFSET)          identity string, 'SharedBuffer~'
         [_LENGTH_START - 1)         lock byte: 'w', 'r', ' ' or '\\x00'
-        [_LENGTH_START, _DATA_OFFSET)  payload length, _LENGTH_OFFSET bytes, little-endian
-        [_DATA_OFFSET : )              payload, exactly `length` bytes of it valid
+        [_LENGTH_START, _SUCCESSOR_START)  payload length, _LENGTH_OFFSET bytes, little-endian
+        [_SUCCESSOR_START, _DATA_OFFSET)   forwarding record: successor epoch, 0 while live (item 35)
+        [_DATA_OFFSET : +length)       payload
+        [+length : +length+4)          key directory slot count, 0 for none (item 31)
+        [+length+4 : )                 key directory slots, see `_encode_indexed`
 
     The payload length is stored explicitly rather than delimited by a NUL
     terminator. The terminator scheme cost 78 us of an 85 us read on an 8 KB
@@ -81,6 +209,26 @@ class SharedBuffer:
     valid bytes and the cost stops scaling with the segment size. It also removes
     the constraint that the encoding may not contain a NUL byte, which no longer
     rules out a binary codec.
+
+    The key directory behind the payload is optional and invisible to `read`, which
+    stops at `length`. Only `write(..., index=True)` produces one and only `read_key`
+    consumes it. A write without one still stamps a zero slot count when there is room,
+    so a directory left over from an earlier write is never taken to describe the
+    current payload.
+
+    A segment cannot be resized in place, so a `growable` buffer (the creating handle
+    only) moves instead (item 35). When a write does not fit, the owner creates a
+    successor segment `<name>_grown<epoch>` at least twice the size, writes the payload
+    there, and only then stamps the epoch into the forwarding record of the segment it
+    is leaving and of the original one. Every handle checks its own segment's record
+    before reading, and a writer checks again once it holds the lock. A handle that finds
+    the record set resolves the newest epoch through the original segment and
+    re-attaches. The original segment stays in place until `terminate`, because its name
+    is the one peers attach by. Intermediate successors are unlinked as soon as they are
+    retired; a peer still mapping one keeps a valid mapping, and its next check sends it
+    on. A reader that checked just before a move reads the retired segment one last time,
+    which is the stale-by-one-write read `SharedDict`'s generation counter already
+    covers.
     """
 
     _CLASS_NAME = 'SharedBuffer'
@@ -88,10 +236,13 @@ class SharedBuffer:
     _READ_OFFSET = len(_CLASS_NAME) + 1  # The identity string occupies the first bytes
     _LOCK_OFFSET = 1  # The next byte represents the lock status of the shared buffer
     _LENGTH_OFFSET = 4  # The next 4 bytes hold the payload length; 4 covers _MAX_BUFFER_SIZE
+    _SUCCESSOR_OFFSET = 4  # The next 4 bytes hold the forwarding record (item 35)
     _LENGTH_START = _READ_OFFSET + _LOCK_OFFSET
-    _DATA_OFFSET = _READ_OFFSET + _LOCK_OFFSET + _LENGTH_OFFSET  # The payload starts here
+    _SUCCESSOR_START = _LENGTH_START + _LENGTH_OFFSET
+    _DATA_OFFSET = _SUCCESSOR_START + _SUCCESSOR_OFFSET  # The payload starts here
+    _FOLLOW_LIMIT = 8  # Re-attach attempts before a writer gives up on a moving buffer
 
-    def __init__(self, name, lock, use_RWLock=False, data=None, size=None, create=True):
+    def __init__(self, name, lock, use_RWLock=False, data=None, size=None, create=True, growable=False):
         """
         Initializes the SharedBuffer object.
 
@@ -102,6 +253,9 @@ class SharedBuffer:
             data (any, optional): Initial data to write into the shared memory.
             size (int, optional): The size of the shared memory. If not specified, it's calculated based on the data.
             create (bool): If True, a new shared memory segment is created. Otherwise, an existing segment is used.
+            growable (bool): Move to a larger segment instead of raising when a write does
+                not fit (item 35). Honoured on the creating handle only: the segments it
+                allocates are tied to its process, so a peer that attaches never grows one.
 
         Raises:
             ValueError: If required parameters are missing or incorrect.
@@ -113,6 +267,9 @@ class SharedBuffer:
         self._use_RWLock = use_RWLock
         self._lockbyte_ctx = None
         self._lockbyte_view = None
+        self._growable = growable and create
+        self._epoch = 0  # Which successor this handle is mapped to; 0 is the original segment
+        self._root_memory = None  # The original segment, kept by the owner once it has moved
 
         byte_data = None
 
@@ -158,6 +315,8 @@ class SharedBuffer:
                 print(traceback.format_exc())
                 self.close()
                 raise TypeError(f'[{self._CLASS_NAME} - {self._name}] Unsupported type of shared memory')
+            if self._read_successor():
+                self._reattach()
             # if data:
             #     self.write(data)
 
@@ -194,6 +353,7 @@ class SharedBuffer:
         # instead of two. Both were already treated as equivalent everywhere that reads
         # the byte, so this changes no observable behaviour on the read side.
         self._shared_memory.buf[self._READ_OFFSET:self._LENGTH_START] = b' '
+        self._shared_memory.buf[self._SUCCESSOR_START:self._DATA_OFFSET] = bytes(self._SUCCESSOR_OFFSET)
         self._lock.release()
 
     def _read_header(self):
@@ -244,19 +404,146 @@ class SharedBuffer:
         """
         # private method for reading how many payload bytes are valid (self._LENGTH_START)
 
-        return int.from_bytes(bytes(self._shared_memory.buf[self._LENGTH_START:self._DATA_OFFSET]), 'little')
+        return int.from_bytes(bytes(self._shared_memory.buf[self._LENGTH_START:self._SUCCESSOR_START]), 'little')
 
-    def _write_length(self, nbytes):
-        """Raw write of the payload-length field.
+    def _write_length(self, nbytes, segment=None):
+        """Raw write of the payload-length field, of this handle's segment unless `segment` is given.
 
-        Called by `write` only after the payload bytes are already in place and only
-        while holding the write lock -- see `write` for why that ordering (payload
-        before length) matters to a reader that gets in mid-write.
+        Called by `_store` only after the payload bytes are already in place -- see
+        `write` for why that ordering (payload before length) matters to a reader that
+        gets in mid-write. On the live segment that is under the write lock; `_grow` also
+        passes a successor no peer can see yet.
         """
         # private method for recording how many payload bytes are valid (self._LENGTH_START)
 
-        self._shared_memory.buf[self._LENGTH_START:self._DATA_OFFSET] = \
-            nbytes.to_bytes(self._LENGTH_OFFSET, 'little')
+        segment = self._shared_memory if segment is None else segment
+        segment.buf[self._LENGTH_START:self._SUCCESSOR_START] = nbytes.to_bytes(self._LENGTH_OFFSET, 'little')
+
+    def _store(self, segment, byte_data, directory):
+        """Copy payload and directory into `segment`, then publish the length."""
+        if byte_data:
+            segment.buf[self._DATA_OFFSET:(self._DATA_OFFSET + len(byte_data))] = byte_data
+        if directory:
+            directory_start = self._DATA_OFFSET + len(byte_data)
+            segment.buf[directory_start:(directory_start + len(directory))] = directory
+        self._write_length(len(byte_data), segment)
+
+    def _read_successor(self, segment=None):
+        """The forwarding record of this handle's segment (or `segment`): 0 while it is live.
+
+        A plain slice load, like `SharedDict.generation`: it runs before every read, and
+        only the owner ever writes it, once per segment.
+        """
+        segment = self._shared_memory if segment is None else segment
+        return int.from_bytes(bytes(segment.buf[self._SUCCESSOR_START:self._DATA_OFFSET]), 'little')
+
+    def _successor_name(self, epoch):
+        """Name of the segment the owner allocates on its `epoch`-th move."""
+        return f'{self._name}_grown{epoch}'
+
+    def _reattach(self):
+        """Move this handle to the newest successor the original segment names (item 35).
+
+        The original segment is consulted rather than the record of the segment being
+        left, because that one names the successor current *when it was retired*, which
+        may itself be gone. A successor that vanishes between the two lookups has been
+        retired in turn, so the lookup simply repeats. Returns True if the handle moved;
+        False leaves it on its current segment (the owner has terminated).
+        """
+        moved = False
+        for _ in range(self._FOLLOW_LIMIT):
+            if self._root_memory is not None:
+                epoch = self._read_successor(self._root_memory)
+            else:
+                try:
+                    root = shared_memory.SharedMemory(name=self._name)
+                except FileNotFoundError:
+                    return moved
+                try:
+                    epoch = self._read_successor(root)
+                finally:
+                    root.close()
+            if epoch == self._epoch:
+                return moved
+            try:
+                successor = shared_memory.SharedMemory(name=self._successor_name(epoch))
+            except FileNotFoundError:
+                continue
+            self._release_lockbyte_view()
+            self._shared_memory.close()
+            self._shared_memory = successor
+            self._epoch = epoch
+            self._size = successor.size - self._DATA_OFFSET
+            moved = True
+            if not self._read_successor():
+                return moved
+        return moved
+
+    def _grow(self, byte_data, directory):
+        """Write to a successor segment big enough for the payload, then forward to it (item 35).
+
+        The payload lands in the successor *before* the forwarding record is stamped, so
+        a peer that follows the record always finds the new contents, never an empty
+        segment. The record is stamped under the current segment's write lock: a peer
+        writer that was waiting on that lock finds the record once it gets in, and takes
+        its write to the successor instead of into a segment nobody reads any more.
+
+        Raises:
+            ValueError: If the payload exceeds what even the largest segment could hold.
+        """
+        needed = len(byte_data) + len(directory)
+        limit = self._MAX_BUFFER_SIZE - self._DATA_OFFSET
+        if len(byte_data) > limit:
+            raise ValueError(
+                f'[{self._CLASS_NAME} - {self._name}] Encoded data ({len(byte_data)} bytes) is larger than '
+                f'the maximum size (16 MB) supported.')
+        size = max(self._size, 1)
+        while size < needed:
+            size *= 2
+        size = min(size, limit)
+        if needed > size:
+            directory = b''
+        if not directory and len(byte_data) + _DIRECTORY_COUNT.size <= size:
+            directory = _DIRECTORY_COUNT.pack(0)
+
+        epoch = self._epoch + 1
+        successor = shared_memory.SharedMemory(create=True, name=self._successor_name(epoch),
+                                               size=size + self._DATA_OFFSET)
+        successor.buf[:self._READ_OFFSET] = f'{self._CLASS_NAME}~'.encode('utf-8')
+        successor.buf[self._READ_OFFSET:self._LENGTH_START] = b' '
+        self._store(successor, byte_data, directory)
+
+        if not self._use_RWLock:
+            lock_acquired = self._lock.acquire(timeout=0.1)
+        else:
+            lock_acquired = self.aquire_RWlock('w', timeout=1000)
+        if not lock_acquired:
+            successor.close()
+            successor.unlink()
+            warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to write data from shared memory')
+            return
+        try:
+            record = epoch.to_bytes(self._SUCCESSOR_OFFSET, 'little')
+            self._shared_memory.buf[self._SUCCESSOR_START:self._DATA_OFFSET] = record
+            if self._root_memory is not None:
+                self._root_memory.buf[self._SUCCESSOR_START:self._DATA_OFFSET] = record
+        finally:
+            if not self._use_RWLock:
+                self._lock.release()
+            else:
+                self.release_RWlock()
+
+        retired = self._shared_memory
+        self._release_lockbyte_view()
+        if self._root_memory is None:
+            # Kept: it is the name every peer attaches by, and where they look the epoch up.
+            self._root_memory = retired
+        else:
+            retired.close()
+            retired.unlink()
+        self._shared_memory = successor
+        self._epoch = epoch
+        self._size = size
 
     def aquire_RWlock(self, operation, timeout=1000):
 
@@ -337,10 +624,11 @@ class SharedBuffer:
         """
         Returns:
             int: The size of the data area in the shared memory segment (excluding header and lock areas).
+                For a growable buffer, of the segment this handle is currently mapped to.
         """
         return self._size
 
-    def write(self, data):
+    def write(self, data, index=False):
         """
         Writes data to the shared memory.
 
@@ -364,11 +652,23 @@ class SharedBuffer:
         length can address a partly overwritten payload, which fails to decode and
         reads as None, and `SharedDict._refresh` retries.
 
+        With `index=True` a dict payload is written with a key directory behind it (see
+        `_encode_indexed` and `read_key`). When payload and directory together do not
+        fit, it is the directory that is dropped, never the write; readers then fall
+        back to `read`. A growable buffer moves to a larger segment instead of dropping
+        anything (see `_grow`).
+
+        A writer whose segment the owner has retired meanwhile finds the forwarding
+        record once it holds the lock, and re-attaches and retries rather than writing
+        into a segment nobody reads any more.
+
         Parameters:
             data (any): The data to be written into the shared memory. It should be serializable.
+            index (bool): Also write a key directory, so `read_key` can decode a single value.
 
         Raises:
-            ValueError: If the encoded data does not fit the data region.
+            ValueError: If the encoded data does not fit the data region and the buffer
+                is not growable, or exceeds the maximum size.
             TypeError: Propagated from the JSON encoder for a value it cannot represent
                 (every numpy scalar dtype except float64, for instance).
             Warning: If there's a timeout or failure in acquiring the lock for writing.
@@ -376,25 +676,47 @@ class SharedBuffer:
 
         # None is written as an empty region rather than as the literal 'null', which
         # is what read() reports back as None.
-        byte_data = b'' if data is None else _encode(data)
+        directory = b''
+        if data is None:
+            byte_data = b''
+        elif index:
+            byte_data, directory = _encode_indexed(data)
+        else:
+            byte_data = _encode(data)
+        if self._growable and len(byte_data) + len(directory) > self._size:
+            self._grow(byte_data, directory)
+            return
         if len(byte_data) > self._size:
             raise ValueError(
                 f'[{self._CLASS_NAME} - {self._name}] Encoded data ({len(byte_data)} bytes) does not fit '
                 f'the data region ({self._size} bytes).')
+        if len(byte_data) + len(directory) > self._size:
+            directory = b''
+        if not directory and len(byte_data) + _DIRECTORY_COUNT.size <= self._size:
+            directory = _DIRECTORY_COUNT.pack(0)
 
-        if not self._use_RWLock:
-            lock_acquired = self._lock.acquire(timeout=0.1)
-        else:
-            lock_acquired = self.aquire_RWlock('w', timeout=1000)
+        lock_acquired = False
+        for _ in range(self._FOLLOW_LIMIT):
+            if not self._use_RWLock:
+                lock_acquired = self._lock.acquire(timeout=0.1)
+            else:
+                lock_acquired = self.aquire_RWlock('w', timeout=1000)
+            if not lock_acquired or not self._read_successor():
+                break
+            if not self._use_RWLock:
+                self._lock.release()
+            else:
+                self.release_RWlock()
+            lock_acquired = False
+            if not self._reattach():
+                break
 
         if not lock_acquired:
             warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to write data from shared memory')
             return
 
         try:
-            if byte_data:
-                self._shared_memory.buf[self._DATA_OFFSET:(self._DATA_OFFSET + len(byte_data))] = byte_data
-            self._write_length(len(byte_data))
+            self._store(self._shared_memory, byte_data, directory)
         finally:
             if not self._use_RWLock:
                 self._lock.release()
@@ -423,6 +745,8 @@ class SharedBuffer:
         """
 
         data = None
+        if self._read_successor():
+            self._reattach()
         if not self._use_RWLock:
             lock_acquired = self._lock.acquire(timeout=0.1)
         else:
@@ -453,6 +777,74 @@ class SharedBuffer:
 
         return data
 
+    def read_key(self, key):
+        """Decode one value of a dict payload through its key directory (item 31).
+
+        Returns `(True, value)` for a key that is present, `(False, None)` for one that
+        is not, and None when the question cannot be answered this way: there is no
+        directory (the last write was not indexed, or the directory did not fit), the
+        lock could not be taken, or what was found does not hold together. None means
+        "fall back to `read`", never "absent".
+
+        Only the value's own bytes are decoded, so the cost does not grow with the
+        number of other keys in the payload. A slot is trusted only when its hash, its
+        key length and the key bytes themselves all match, and only when every offset it
+        names lies inside the current payload. A read that overlaps a write (the reader
+        side of the lock is still racy, see `aquire_RWlock`) either fails one of those
+        checks or fails to decode, and both end in None.
+        """
+        try:
+            encoded_key = _ENCODER.encode(key).encode('utf-8')
+        except TypeError:
+            return None
+        key_hash = _zlib.crc32(encoded_key)
+        if self._read_successor():
+            self._reattach()
+
+        if not self._use_RWLock:
+            lock_acquired = self._lock.acquire(timeout=0.1)
+        else:
+            lock_acquired = self.aquire_RWlock('r', timeout=1000)
+        if not lock_acquired:
+            return None
+
+        try:
+            buf = self._shared_memory.buf
+            nbytes = self._read_length()
+            directory_start = self._DATA_OFFSET + nbytes
+            region_end = self._DATA_OFFSET + self._size
+            if nbytes > self._size or directory_start + _DIRECTORY_COUNT.size > region_end:
+                return None
+            n_slots = _DIRECTORY_COUNT.unpack_from(buf, directory_start)[0]
+            slots_start = directory_start + _DIRECTORY_COUNT.size
+            if n_slots == 0 or n_slots & (n_slots - 1) or \
+                    slots_start + n_slots * _DIRECTORY_SLOT.size > region_end:
+                return None
+            mask = n_slots - 1
+            slot = key_hash & mask
+            for _ in range(n_slots):
+                slot_hash, key_len, value_offset, value_len = _DIRECTORY_SLOT.unpack_from(
+                    buf, slots_start + slot * _DIRECTORY_SLOT.size)
+                if value_len == 0:
+                    return False, None
+                if slot_hash == key_hash and key_len == len(encoded_key):
+                    key_offset = value_offset - 2 - key_len
+                    if key_offset < 1 or value_offset + value_len > nbytes:
+                        return None
+                    key_start = self._DATA_OFFSET + key_offset
+                    if bytes(buf[key_start:(key_start + key_len)]) == encoded_key:
+                        value_start = self._DATA_OFFSET + value_offset
+                        return True, json.loads(bytes(buf[value_start:(value_start + value_len)]))
+                slot = (slot + 1) & mask
+            return False, None
+        except Exception:
+            return None
+        finally:
+            if not self._use_RWLock:
+                self._lock.release()
+            else:
+                self.release_RWlock()
+
     def clear(self):
         """
         Clears the data in the shared memory. This is equivalent to writing None.
@@ -477,15 +869,22 @@ class SharedBuffer:
                 pass
             self._lockbyte_view = None
         self._shared_memory.close()
+        if self._root_memory is not None:
+            self._root_memory.close()
 
     def terminate(self):
         """
         Clears the shared memory and unlinks it. This should be used to completely remove the shared memory segment.
+
+        After a move (item 35) that is both segments the owner still holds: the current
+        successor and the original one peers attach by.
         """
 
         self.clear()
         self.close()
         self._shared_memory.unlink()
+        if self._root_memory is not None:
+            self._root_memory.unlink()
 
     def __del__(self):
         """Best-effort cleanup for a handle whose owner never called `close()`.
@@ -533,14 +932,58 @@ class SharedNdarray:
     """
     SharedNdarray allows efficient sharing of NumPy arrays between processes using shared memory. It is useful for large data
     sets where duplicating data for each process is not feasible due to memory constraints.
+
+    Two modes, fixed when the segment is created and recorded in its header, so every
+    handle that attaches later picks the same one up:
+
+    - ``'locked'`` (default) -- one copy of the array behind the lock byte. Readers and
+      writers take turns, and every `read` copies under the lock. A write also bumps a
+      sequence word kept in the last four bytes of the header region, which is what a
+      `borrow` is validated against (item 34).
+    - ``'latest'`` (item 32) -- three copies and a published index, for arrays with one
+      producer and readers that only want the newest value: camera frames,
+      `APP_FBO_PREVIEW`. A write never waits for a reader, and a read never returns a
+      frame that was being overwritten. A reader that falls behind simply gets the
+      newest frame; skipped ones are gone, which is the point.
+
+    Segment layout in ``'latest'`` mode::
+
+        [0 : _READ_OFFSET)                 JSON header, '...~latest'
+        [_READ_OFFSET]                     lock byte -- writers only
+        [_LATEST_CONTROL_OFFSET : +4)      published word: frame << 2 | slot
+        [+4 : +16)                         per-slot sequence, odd while being written
+        [+16 : +28)                        per-slot frame number
+        [_LATEST_SLOTS_OFFSET : )          three slots, each `size` rounded up to 64 bytes
+
+    The per-slot sequence is a seqlock. The writer makes it odd, fills the slot, makes it
+    even again, and only then publishes the slot. A reader copies the published slot and
+    keeps the copy only if the sequence was even and unchanged across it; otherwise the
+    writer lapped it -- three writes within one copy -- and it retries on the new slot.
+    The writer takes the next slot round-robin, so the slot just published is never the
+    one being written, and a reader has two whole write periods to finish its copy.
+
+    Writers still serialize on the lock byte's CAS, so a foreign `set_state_to` into a
+    peer's buffer stays safe alongside the owner's writes; readers never touch it. The
+    writer side uses atomics for the sequence and the publish, which double as the
+    ordering barriers. The reader side uses plain loads, as `SharedDict.generation`
+    does -- an `atomics` load measured 8-18 us here, more than the copy of a small frame.
     """
 
     _CLASS_NAME = 'SharedNdarray'
     _MAX_BUFFER_SIZE = 2 ** 32  # Maximum shared memory: 4 GB
     _READ_OFFSET = 512  # The first 512 bytes represents the valid size of the shared buffer
     _LOCK_OFFSET = 1  # The next byte represents the lock status of the shared buffer
-
-    def __init__(self, name, lock: Lock, data=None, create=True, use_RWLock=True):
+    _SEQUENCE_OFFSET = _READ_OFFSET - 4  # 'locked' mode's write sequence, the header's last 4 bytes
+    MODES = ('locked', 'latest')
+    _LATEST_SLOTS = 3
+    _LATEST_CONTROL_OFFSET = 520  # 8-aligned, past the lock byte
+    _LATEST_SEQUENCE_OFFSET = _LATEST_CONTROL_OFFSET + 4
+    _LATEST_FRAME_OFFSET = _LATEST_SEQUENCE_OFFSET + 4 * _LATEST_SLOTS
+    _LATEST_SLOTS_OFFSET = 576  # 64-aligned, so each slot starts on its own cache line
+    _LATEST_SLOT_ALIGN = 64
+    _WORD = _struct.Struct('<I')
+
+    def __init__(self, name, lock: Lock, data=None, create=True, use_RWLock=True, mode='locked'):
         """
         Initializes a SharedNdarray object.
 
@@ -550,9 +993,11 @@ class SharedNdarray:
             data (np.ndarray, optional): Initial array data to store in shared memory.
             create (bool): Flag to indicate whether to create a new shared memory segment.
             use_RWLock (bool): Flag to indicate the use of a read-write lock for thread safety.
+            mode (str): 'locked' or 'latest' -- see the class docstring. Only consulted
+                when creating; an attaching handle takes the mode from the header.
 
         Raises:
-            ValueError: If data is None when create is True.
+            ValueError: If data is None when create is True, or `mode` is not one of `MODES`.
         """
 
         self._name = name
@@ -560,26 +1005,37 @@ class SharedNdarray:
         self._use_RWLock = use_RWLock
         self._lockbyte_ctx = None
         self._lockbyte_view = None
+        self._latest_ctx = []
+        self._latest_views = None
+        self._read_retries = 0
+        self.last_read_frame = None
 
         self._shared_memory = None
         self._dtype = None
         self._data = None
+        self._slots = None
 
         if create:
             if data is None:
                 raise ValueError(
                     f'[{self._CLASS_NAME} - {self._name}] Shared ndarray cannot be created: Data cannot be None')
+            if mode not in self.MODES:
+                raise ValueError(f'[{self._CLASS_NAME} - {self._name}] Unknown mode {mode!r}; expected one of '
+                                 f'{self.MODES}')
+            self._mode = mode
             self._shape = data.shape
             self._dtype = data.dtype.str
             # Same quantity `_read_header` derives on the attach path, so `size` reads
             # the same on a creator as on anyone who attaches to the segment later.
             self._size = data.nbytes
+            if mode == 'latest':
+                segment_size = self._LATEST_SLOTS_OFFSET + self._LATEST_SLOTS * self._latest_stride()
+            else:
+                segment_size = data.nbytes + self._READ_OFFSET + self._LOCK_OFFSET
             try:
-                self._shared_memory = shared_memory.SharedMemory(create=True, name=self._name,
-                                                                 size=data.nbytes + self._READ_OFFSET + self._LOCK_OFFSET)
+                self._shared_memory = shared_memory.SharedMemory(create=True, name=self._name, size=segment_size)
                 self._write_header()
-                self._data = np.ndarray(shape=self._shape, dtype=self._dtype, buffer=self._shared_memory.buf,
-                                        offset=self._READ_OFFSET + self._LOCK_OFFSET)
+                self._map_data()
                 self.write(data)
             except Exception:
                 if self._shared_memory is not None:
@@ -595,8 +1051,7 @@ class SharedNdarray:
                 self.close()
                 raise TypeError(f'[{self._CLASS_NAME} - {self._name}] Unsupported type of shared memory')
 
-            self._data = np.ndarray(shape=self._shape, dtype=self._dtype, buffer=self._shared_memory.buf,
-                                    offset=self._READ_OFFSET + self._LOCK_OFFSET)
+            self._map_data()
             if data is not None:
                 try:
                     self.write(data)
@@ -623,6 +1078,43 @@ class SharedNdarray:
         """The array's shape, as recorded by `_write_header`/decoded by `_read_header`."""
         return self._shape
 
+    @property
+    def mode(self):
+        """'locked' or 'latest', as recorded in the segment header."""
+        return self._mode
+
+    @property
+    def frame(self):
+        """Number of the last frame published in 'latest' mode; None in 'locked' mode.
+
+        One plain 4-byte load, no copy: a poller can compare it with `last_read_frame`
+        and skip a `read` that would only return the frame it already has. Wraps at 2**30.
+        """
+        if self._mode != 'latest':
+            return None
+        return self._WORD.unpack_from(self._shared_memory.buf, self._LATEST_CONTROL_OFFSET)[0] >> 2
+
+    @property
+    def read_retries(self):
+        """Reads in 'latest' mode that found their slot being rewritten and started over."""
+        return self._read_retries
+
+    def _latest_stride(self):
+        """Bytes per slot in 'latest' mode: the array, rounded up to a whole cache line."""
+        align = self._LATEST_SLOT_ALIGN
+        return (int(self._size) + align - 1) // align * align
+
+    def _map_data(self):
+        """Build the ndarray view(s) over the segment for this handle's mode."""
+        if self._mode == 'latest':
+            stride = self._latest_stride()
+            self._slots = [np.ndarray(shape=self._shape, dtype=self._dtype, buffer=self._shared_memory.buf,
+                                      offset=self._LATEST_SLOTS_OFFSET + i * stride)
+                           for i in range(self._LATEST_SLOTS)]
+        else:
+            self._data = np.ndarray(shape=self._shape, dtype=self._dtype, buffer=self._shared_memory.buf,
+                                    offset=self._READ_OFFSET + self._LOCK_OFFSET)
+
     @property
     def size(self):
         """The payload size in bytes, excluding the header and lock byte.
@@ -705,6 +1197,79 @@ class SharedNdarray:
         """Clear the lock byte to 'free'. Must be called after a successful acquire."""
         self._write_lockbyte(' ')
 
+    def _latest_atomicviews(self):
+        """The published word and the three sequence words as atomic views, opened once."""
+        if self._latest_views is None:
+            views = []
+            offsets = [self._LATEST_CONTROL_OFFSET] + [self._LATEST_SEQUENCE_OFFSET + 4 * i
+                                                       for i in range(self._LATEST_SLOTS)]
+            for offset in offsets:
+                ctx = _atomics.atomicview(buffer=self._shared_memory.buf[offset:(offset + 4)], atype=_atomics.UINT)
+                views.append(ctx.__enter__())
+                self._latest_ctx.append(ctx)
+            self._latest_views = views
+        return self._latest_views
+
+    def _close_latest_views(self):
+        """Exit every atomic view `_latest_atomicviews` opened."""
+        for ctx in self._latest_ctx:
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception:
+                pass
+        self._latest_ctx = []
+        self._latest_views = None
+
+    def _read_latest(self, timeout=1000, out=None):
+        """Copy the newest complete frame without taking any lock (item 32).
+
+        See the class docstring for the protocol. `timeout` bounds the retries, not the
+        time: each retry means the writer completed three frames during one copy, so
+        running out of them takes a writer far faster than the reader can copy. With
+        `out` the frame is copied into it instead of into a new array (`read_into`).
+        """
+        buf = self._shared_memory.buf
+        word = self._WORD
+        for _ in range(timeout):
+            slot = word.unpack_from(buf, self._LATEST_CONTROL_OFFSET)[0] & 3
+            if slot >= self._LATEST_SLOTS:
+                break
+            sequence_offset = self._LATEST_SEQUENCE_OFFSET + 4 * slot
+            before = word.unpack_from(buf, sequence_offset)[0]
+            if not before & 1:
+                frame = word.unpack_from(buf, self._LATEST_FRAME_OFFSET + 4 * slot)[0]
+                if out is None:
+                    data = self._slots[slot].copy()
+                else:
+                    np.copyto(out, self._slots[slot])
+                    data = out
+                if word.unpack_from(buf, sequence_offset)[0] == before:
+                    self.last_read_frame = frame
+                    return data
+            self._read_retries += 1
+        warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to read data from shared memory')
+        return None
+
+    def _write_latest(self, data):
+        """Write into the slot after the published one, then publish it (item 32).
+
+        Called with the write lock held. The sequence goes back to even in a `finally`,
+        so an assignment that raises (shape or dtype mismatch) leaves the slot looking
+        idle rather than permanently mid-write; it is simply not published, and its
+        bytes are never pointed at.
+        """
+        published, *sequences = self._latest_atomicviews()
+        current = published.load()
+        slot = ((current & 3) + 1) % self._LATEST_SLOTS
+        frame = ((current >> 2) + 1) & 0x3FFFFFFF
+        sequences[slot].inc()
+        try:
+            self._WORD.pack_into(self._shared_memory.buf, self._LATEST_FRAME_OFFSET + 4 * slot, frame)
+            self._slots[slot][:] = data
+        finally:
+            sequences[slot].inc()
+        published.store((frame << 2) | slot)
+
     def read(self):
         """Return a copy of the array, taken while holding the read (or instance) lock.
 
@@ -713,7 +1278,11 @@ class SharedNdarray:
         the shared buffer directly and would otherwise let the caller observe a
         concurrent write mid-flight. Returns None (with a warning) if the lock could
         not be acquired within the timeout.
+
+        In 'latest' mode no lock is taken at all; see `_read_latest`.
         """
+        if self._mode == 'latest':
+            return self._read_latest()
         if self._use_RWLock:
             lock_acquired = self.aquire_RWlock('r')
         else:
@@ -731,6 +1300,80 @@ class SharedNdarray:
                 self._lock.release()
         return data
 
+    def read_into(self, out):
+        """Copy the array into `out`, a caller-owned array of the same shape, and return `out`.
+
+        Same locking and retry behaviour as `read`, minus the allocation: `read` returns
+        a fresh array every call, which for a 1920x1080x3 preview is 6 MB of allocator
+        and page-fault work per tick on top of the copy itself (item 34). Returns None
+        (with a warning) when `read` would, leaving `out` unspecified.
+
+        Raises:
+            ValueError: If `out` is not shaped like the shared array.
+        """
+        if out.shape != self._shape:
+            raise ValueError(f'[{self._CLASS_NAME} - {self._name}] out has shape {out.shape}, '
+                             f'expected {self._shape}')
+        if self._mode == 'latest':
+            return self._read_latest(out=out)
+        if self._use_RWLock:
+            lock_acquired = self.aquire_RWlock('r')
+        else:
+            lock_acquired = self._lock.acquire()
+        if not lock_acquired:
+            warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to read data from shared memory')
+            return None
+        try:
+            np.copyto(out, self._data)
+        finally:
+            if self._use_RWLock:
+                self.release_RWlock()
+            else:
+                self._lock.release()
+        return out
+
+    def borrow(self, timeout=1000):
+        """A read-only view of the current array, with no copy and no lock held (item 34).
+
+        Use as a context manager and check `valid` once done with the view::
+
+            with frame_buffer.borrow() as borrowed:
+                preview = render(borrowed.array)
+                if not borrowed.valid:
+                    ...  # a writer got there while we read; discard and retry
+
+        `valid` compares the sequence word the view was taken at with its current value:
+        'locked' mode's header sequence, or in 'latest' mode the borrowed slot's own --
+        which the writer does not reach for another two writes, so there a borrow
+        outlives the next frame. Nothing blocks the writer, so nothing stops it either:
+        work done on an invalid view must be thrown away. A view taken mid-write is never
+        handed out; after `timeout` tries the borrow comes back already invalid.
+        """
+        buf = self._shared_memory.buf
+        word = self._WORD
+        for _ in range(timeout):
+            if self._mode == 'latest':
+                slot = word.unpack_from(buf, self._LATEST_CONTROL_OFFSET)[0] & 3
+                array = self._slots[slot]
+                sequence_offset = self._LATEST_SEQUENCE_OFFSET + 4 * slot
+                frame = word.unpack_from(buf, self._LATEST_FRAME_OFFSET + 4 * slot)[0]
+            else:
+                array = self._data
+                sequence_offset = self._SEQUENCE_OFFSET
+                frame = None
+            sequence = word.unpack_from(buf, sequence_offset)[0]
+            if not sequence & 1:
+                return _Borrow(buf, array, sequence_offset, sequence, frame)
+            self._read_retries += 1
+        warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to borrow a stable view')
+        return _Borrow(buf, array, sequence_offset, None, None)
+
+    def _bump_sequence(self):
+        """Advance 'locked' mode's sequence word. Called with the write lock held, twice per write."""
+        buf = self._shared_memory.buf
+        self._WORD.pack_into(buf, self._SEQUENCE_OFFSET,
+                             (self._WORD.unpack_from(buf, self._SEQUENCE_OFFSET)[0] + 1) & 0xFFFFFFFF)
+
     def write(self, data):
         """
         Writes an array into the shared segment.
@@ -745,6 +1388,9 @@ class SharedNdarray:
         `SharedBuffer.write`: a shape or dtype mismatch raises inside the critical
         section, and without it the lock byte would stay at 'w' for the remaining life
         of the segment.
+
+        In 'latest' mode the lock only serializes writers against each other; readers
+        never take it, so it is never waited on by a frame being copied out.
         """
         if self._use_RWLock:
             lock_acquired = self.aquire_RWlock('w')
@@ -756,7 +1402,17 @@ class SharedNdarray:
             return None
 
         try:
-            self._data[:] = data
+            if self._mode == 'latest':
+                self._write_latest(data)
+            else:
+                # Odd for the duration of the copy, even again after -- even when the
+                # assignment raises, so a failed write cannot leave every later borrow
+                # looking mid-write. Plain stores under the write lock; see `borrow`.
+                self._bump_sequence()
+                try:
+                    self._data[:] = data
+                finally:
+                    self._bump_sequence()
         finally:
             if self._use_RWLock:
                 self.release_RWlock()
@@ -767,11 +1423,16 @@ class SharedNdarray:
         """
         Writes the header information to the shared memory, including class name, shape, and dtype of the ndarray.
         """
-        header = json.dumps(f'{self._CLASS_NAME}~{self._shape}~{self._dtype}').encode('utf-8')
-        place_holder = ' ' * (self._READ_OFFSET - len(header))
+        # A 'locked' header is left exactly as it always was, so segments created in the
+        # default mode stay readable by handles that predate the mode field.
+        identity = f'{self._CLASS_NAME}~{self._shape}~{self._dtype}'
+        if self._mode != 'locked':
+            identity += f'~{self._mode}'
+        header = json.dumps(identity).encode('utf-8')
+        place_holder = ' ' * (self._SEQUENCE_OFFSET - len(header))
 
         self._lock.acquire()
-        self._shared_memory.buf[:self._READ_OFFSET] = header + place_holder.encode('utf-8')
+        self._shared_memory.buf[:self._READ_OFFSET] = header + place_holder.encode('utf-8') + bytes(4)
         # Explicit ' ' rather than the OS's zero-fill ('\x00'): the write-lock's atomic
         # CAS (aquire_RWlock, item 15) needs exactly one "free" value to compare against.
         self._shared_memory.buf[self._READ_OFFSET:(self._READ_OFFSET + self._LOCK_OFFSET)] = b' '
@@ -783,7 +1444,7 @@ class SharedNdarray:
         """
 
         self._lock.acquire()
-        _decoded_header = bytes(self._shared_memory.buf[:self._READ_OFFSET]).decode('utf-8').split('\x00')[0]
+        _decoded_header = bytes(self._shared_memory.buf[:self._SEQUENCE_OFFSET]).decode('utf-8').split('\x00')[0]
         self._lock.release()
 
         identity_string = json.loads(_decoded_header).split('~')
@@ -791,7 +1452,10 @@ class SharedNdarray:
             raise TypeError(f'[{self._CLASS_NAME} - {self._name}] Unsupported type of shared memory')
         else:
             self._shape = tuple([int(x) for x in identity_string[1][1:-1].split(',') if x])
-            self._dtype = identity_string[-1]
+            self._dtype = identity_string[2]
+            self._mode = identity_string[3] if len(identity_string) > 3 else 'locked'
+            if self._mode not in self.MODES:
+                raise TypeError(f'[{self._CLASS_NAME} - {self._name}] Unsupported mode {self._mode!r}')
             bytesize = np.dtype(self._dtype).itemsize
             self._size = np.prod(self._shape) * bytesize
 
@@ -806,10 +1470,11 @@ class SharedNdarray:
             except Exception:
                 pass
             self._lockbyte_view = None
+        self._close_latest_views()
         self._shared_memory.close()
 
     def __del__(self):
-        """Best-effort release of the held-open lock-byte atomic view."""
+        """Best-effort release of the held-open lock-byte and 'latest'-mode atomic views."""
         # Same reason as SharedBuffer.__del__: the parent process opens a view per
         # segment and never calls close(), so without this every clean exit prints an
         # ignored ValueError from atomics' own __del__.
@@ -817,6 +1482,8 @@ class SharedNdarray:
             if getattr(self, '_lockbyte_view', None) is not None:
                 self._lockbyte_ctx.__exit__(None, None, None)
                 self._lockbyte_view = None
+            if getattr(self, '_latest_ctx', None):
+                self._close_latest_views()
         except Exception:
             pass
 
@@ -877,6 +1544,363 @@ class SharedNdarray:
         return is_alive
 
 
+class _Borrow:
+    """A view handed out by `SharedNdarray.borrow`: `array`, plus `valid` to check it afterwards.
+
+    `array` is read-only -- writing through a borrowed view would write into every
+    peer's copy -- and is dropped on leaving the `with` block, so a stale view is not
+    kept around by accident. `frame` is the frame number in 'latest' mode, else None.
+    """
+
+    _WORD = _struct.Struct('<I')
+
+    def __init__(self, buf, array, sequence_offset, sequence, frame):
+        self._buf = buf
+        self._sequence_offset = sequence_offset
+        self._sequence = sequence
+        self.frame = frame
+        self.array = array.view()
+        self.array.flags.writeable = False
+
+    @property
+    def valid(self):
+        """Whether no write has touched the borrowed array since the borrow began."""
+        if self._sequence is None:
+            return False
+        return self._WORD.unpack_from(self._buf, self._sequence_offset)[0] == self._sequence
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.array = None
+
+
+class SharedRing:
+    """
+    A fixed-dtype circular buffer of samples in shared memory, for states written faster
+    than they are read (item 33).
+
+    A state normally holds one value, so a reader polling at 10 ms sees one sample in
+    ten of a writer ticking at 1 ms. A ring keeps the last `capacity` samples together
+    with a write cursor that counts every sample ever written. A reader keeps its own
+    cursor and asks for everything since it (`read_since`), so a live plot, a recorder
+    and a closed-loop controller can each consume the full-rate stream at their own
+    pace, without the writer knowing they exist.
+
+    It is also a drop-in buffer-backed state: `write` appends one sample and `read`
+    returns the newest one, exactly what a `SharedNdarray` of the sample's shape would
+    give. That is how `create_state(..., history=N)` puts one behind the usual `b*`
+    indirection without touching any of the paths that read or write such states.
+
+    Segment layout::
+
+        [0 : _READ_OFFSET)            JSON header, 'SharedRing~capacity~sample_shape~dtype'
+        [_READ_OFFSET]                lock byte -- writers only
+        [_CLAIMED_OFFSET : +8)        samples a writer has started to write
+        [_COMMITTED_OFFSET : +8)      samples written completely -- the cursor
+        [_DATA_OFFSET : )             capacity x sample slots; sample i is slot i % capacity
+
+    Sample `i` is readable while `committed - capacity <= i < committed`. A writer
+    advances `claimed` before it overwrites anything and `committed` after, so a reader
+    that copied a range and then finds `claimed - capacity` past the start of it knows
+    exactly how many of its leading samples may have been overwritten mid-copy, and
+    drops those rather than returning them. Readers take no lock; writers serialize on
+    the lock byte's CAS, as `SharedNdarray` writers do.
+    """
+
+    _CLASS_NAME = 'SharedRing'
+    _READ_OFFSET = 512
+    _LOCK_OFFSET = 1
+    _CLAIMED_OFFSET = 520
+    _COMMITTED_OFFSET = 528
+    _DATA_OFFSET = 576
+    _COUNTER = _struct.Struct('<Q')
+
+    def __init__(self, name, lock: Lock, data=None, capacity=None, create=True, use_RWLock=True):
+        """
+        Create a ring, or attach to an existing one by name.
+
+        Parameters:
+            name (str): Name of the shared memory segment.
+            lock (Lock): Used instead of the lock byte when `use_RWLock` is False.
+            data (np.ndarray): The first sample. Its dtype and shape fix every later one.
+            capacity (int): How many samples are retained. Required when creating.
+            create (bool): Create the segment (True) or attach to it (False).
+            use_RWLock (bool): Serialize writers on the lock byte rather than on `lock`.
+
+        Raises:
+            ValueError: If `data` or a positive `capacity` is missing when creating.
+        """
+        self._name = name
+        self._lock = lock
+        self._use_RWLock = use_RWLock
+        self._shared_memory = None
+        self._views = None
+        self._view_ctx = []
+        self._lockbyte_view = None
+        self._overruns = 0
+
+        if create:
+            if data is None or capacity is None or int(capacity) < 1:
+                raise ValueError(f'[{self._CLASS_NAME} - {self._name}] A ring needs a first sample and a '
+                                 f'positive capacity')
+            data = np.asarray(data)
+            self._capacity = int(capacity)
+            self._shape = data.shape
+            self._dtype = data.dtype.str
+            nbytes = self._capacity * data.nbytes
+            self._shared_memory = shared_memory.SharedMemory(create=True, name=name, size=self._DATA_OFFSET + nbytes)
+            try:
+                header = json.dumps(f'{self._CLASS_NAME}~{self._capacity}~{self._shape}~{self._dtype}').encode('utf-8')
+                self._shared_memory.buf[:self._READ_OFFSET] = header + b' ' * (self._READ_OFFSET - len(header))
+                self._shared_memory.buf[self._READ_OFFSET:(self._READ_OFFSET + self._LOCK_OFFSET)] = b' '
+                self._shared_memory.buf[self._CLAIMED_OFFSET:self._DATA_OFFSET] = bytes(
+                    self._DATA_OFFSET - self._CLAIMED_OFFSET)
+                self._map_data()
+                self.write(data)
+            except Exception:
+                self._release_views()
+                self._samples = None
+                self._shared_memory.close()
+                self._shared_memory.unlink()
+                raise
+        else:
+            self._shared_memory = shared_memory.SharedMemory(name=name)
+            try:
+                identity = json.loads(bytes(self._shared_memory.buf[:self._READ_OFFSET]).decode('utf-8').rstrip())
+                class_name, capacity, shape, dtype = identity.split('~')
+                if class_name != self._CLASS_NAME:
+                    raise TypeError(class_name)
+                self._capacity = int(capacity)
+                self._shape = tuple(int(x) for x in shape[1:-1].split(',') if x)
+                self._dtype = dtype
+            except Exception:
+                self._shared_memory.close()
+                raise TypeError(f'[{self._CLASS_NAME} - {self._name}] Unsupported type of shared memory')
+            self._map_data()
+
+    def _map_data(self):
+        self._samples = np.ndarray(shape=(self._capacity, *self._shape), dtype=self._dtype,
+                                   buffer=self._shared_memory.buf, offset=self._DATA_OFFSET)
+
+    def __enter__(self):
+        """Context-manager entry; returns self unchanged."""
+        return self
+
+    def __exit__(self, *args):
+        """Context-manager exit: closes the handle regardless of how the block exited."""
+        self.close()
+
+    @property
+    def name(self):
+        """The shared-memory segment's name."""
+        return self._name
+
+    @property
+    def shape(self):
+        """The shape of one sample."""
+        return self._shape
+
+    @property
+    def dtype(self):
+        """The dtype of every sample, as a `numpy.dtype.str` string."""
+        return self._dtype
+
+    @property
+    def capacity(self):
+        """How many of the most recent samples the ring retains."""
+        return self._capacity
+
+    @property
+    def cursor(self):
+        """Samples written completely so far. Start a reader here to read only what follows."""
+        return self._COUNTER.unpack_from(self._shared_memory.buf, self._COMMITTED_OFFSET)[0]
+
+    @property
+    def overruns(self):
+        """Samples this handle asked for that had already been overwritten when it read."""
+        return self._overruns
+
+    def _counter_views(self):
+        """`claimed` and `committed` as atomic views, opened once and held."""
+        if self._views is None:
+            views = []
+            for offset in (self._CLAIMED_OFFSET, self._COMMITTED_OFFSET):
+                ctx = _atomics.atomicview(buffer=self._shared_memory.buf[offset:(offset + 8)], atype=_atomics.UINT)
+                views.append(ctx.__enter__())
+                self._view_ctx.append(ctx)
+            self._views = views
+        return self._views
+
+    def _release_views(self):
+        for ctx in self._view_ctx:
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception:
+                pass
+        self._view_ctx = []
+        self._views = None
+        self._lockbyte_view = None
+
+    def _acquire_write(self):
+        """Take the writers' lock: the lock byte's CAS (item 15), or `lock`."""
+        if not self._use_RWLock:
+            return self._lock.acquire(timeout=0.1)
+        if self._lockbyte_view is None:
+            ctx = _atomics.atomicview(
+                buffer=self._shared_memory.buf[self._READ_OFFSET:(self._READ_OFFSET + self._LOCK_OFFSET)],
+                atype=_atomics.UINT)
+            self._lockbyte_view = ctx.__enter__()
+            self._view_ctx.append(ctx)
+        for _ in range(1000):
+            if self._lockbyte_view.cmpxchg_weak(expected=_LOCKBYTE_FREE, desired=_LOCKBYTE_WRITER).success:
+                return True
+        return False
+
+    def _release_write(self):
+        if not self._use_RWLock:
+            self._lock.release()
+        else:
+            self._shared_memory.buf[self._READ_OFFSET:(self._READ_OFFSET + self._LOCK_OFFSET)] = b' '
+
+    def write(self, data):
+        """Append one sample. Same contract as `SharedNdarray.write` for a state."""
+        self.extend(np.asarray(data, dtype=self._dtype).reshape((1, *self._shape)))
+
+    def extend(self, samples):
+        """Append a block of samples, shaped `(n, *shape)`, under one lock and one publish.
+
+        A block longer than the ring keeps only its last `capacity` samples, but the
+        cursor still advances by the whole block, so readers see the rest as overrun
+        rather than silently missing. The shape is checked before anything is claimed,
+        so a mismatched block leaves the ring exactly as it was.
+        """
+        samples = np.asarray(samples, dtype=self._dtype)
+        if samples.shape[1:] != self._shape:
+            raise ValueError(f'[{self._CLASS_NAME} - {self._name}] Samples of shape {samples.shape[1:]} do not '
+                             f'match the ring ({self._shape})')
+        n = len(samples)
+        if n == 0:
+            return
+        if not self._acquire_write():
+            warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to write data to shared memory')
+            return
+        try:
+            claimed, committed = self._counter_views()
+            start = committed.load()
+            claimed.store(start + n)
+            kept = samples[-self._capacity:]
+            first = (start + n - len(kept)) % self._capacity
+            head = min(len(kept), self._capacity - first)
+            self._samples[first:(first + head)] = kept[:head]
+            if head < len(kept):
+                self._samples[:len(kept) - head] = kept[head:]
+            committed.store(start + n)
+        finally:
+            self._release_write()
+
+    def read_since(self, cursor=None):
+        """Every sample written since `cursor`, as one array, and the cursor to pass next.
+
+        Returns `(samples, cursor)`, `samples` shaped `(k, *shape)` and oldest first.
+        `cursor=None` starts from the oldest sample still retained; a fresh reader that
+        wants only what comes next starts from `cursor` instead. Samples already
+        overwritten before or during the copy are not returned: the gap shows as
+        `new_cursor - len(samples) > cursor` and is added to `overruns`. A cursor ahead
+        of the writer (the ring was recreated) is treated as "now".
+        """
+        buf = self._shared_memory.buf
+        committed = self._COUNTER.unpack_from(buf, self._COMMITTED_OFFSET)[0]
+        oldest = max(committed - self._capacity, 0)
+        if cursor is None:
+            cursor = oldest
+        elif cursor > committed:
+            cursor = committed
+        start = max(cursor, oldest)
+        first = start % self._capacity
+        n = committed - start
+        if first + n <= self._capacity:
+            samples = self._samples[first:(first + n)].copy()
+        else:
+            samples = np.concatenate((self._samples[first:], self._samples[:(first + n - self._capacity)]))
+        claimed = self._COUNTER.unpack_from(buf, self._CLAIMED_OFFSET)[0]
+        overwritten = claimed - self._capacity - start
+        if overwritten > 0:
+            samples = samples[overwritten:]
+        self._overruns += committed - cursor - len(samples)
+        return samples, committed
+
+    def read(self):
+        """The newest sample, as a copy shaped like one sample -- what a `SharedNdarray` read gives.
+
+        Returns None (with a warning) when the writer overwrote it mid-copy 1000 times in
+        a row, which takes a ring of one sample and a writer far faster than this reader.
+        Does not count towards `overruns`: only the newest sample was asked for.
+        """
+        buf = self._shared_memory.buf
+        for _ in range(1000):
+            committed = self._COUNTER.unpack_from(buf, self._COMMITTED_OFFSET)[0]
+            sample = self._samples[(committed - 1) % self._capacity].copy()
+            if self._COUNTER.unpack_from(buf, self._CLAIMED_OFFSET)[0] < committed + self._capacity:
+                return sample
+        warnings.warn(f'[{self._CLASS_NAME} - {self._name}] TIMEOUT ERROR; Failed to read data from shared memory')
+        return None
+
+    def close(self):
+        """Release this handle's views and mapping without unlinking the segment."""
+        self._release_views()
+        self._samples = None
+        self._shared_memory.close()
+
+    def terminate(self):
+        """Close this handle and unlink the segment; see `SharedNdarray.terminate` for why it does not wait."""
+        try:
+            self.close()
+        except Exception:
+            pass
+        try:
+            self._shared_memory.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            warnings.warn(f"[{self._CLASS_NAME} - {self._name}] Failed to unlink the shared memory segment:\n"
+                          f"{traceback.format_exc()}")
+
+    def is_alive(self):
+        """Whether the segment can still be attached to by name."""
+        try:
+            shared_memory.SharedMemory(name=self._name, create=False).close()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def __del__(self):
+        """Best-effort release of the held-open atomic views; see `SharedBuffer.__del__`."""
+        try:
+            if getattr(self, '_view_ctx', None):
+                self._release_views()
+        except Exception:
+            pass
+
+
+def open_shared_buffer(name, lock):
+    """Attach to a buffer-backed state's segment, as whichever class created it.
+
+    Behind a `b*` entry there is a `SharedNdarray` or, since item 33, a `SharedRing`.
+    Both answer `read`/`write` the same way, so a peer only needs the right class to
+    attach with; the JSON header at the start of the segment names it.
+    """
+    peek = shared_memory.SharedMemory(name=name)
+    try:
+        head = bytes(peek.buf[:len(SharedRing._CLASS_NAME) + 2])
+    finally:
+        peek.close()
+    if head == f'"{SharedRing._CLASS_NAME}~'.encode('utf-8'):
+        return SharedRing(name, lock, create=False)
+    return SharedNdarray(name, lock=lock, create=False)
+
+
 class SharedDict(dict):
     """A dict whose contents live in a `SharedBuffer`, re-read on every access.
 
@@ -885,11 +1909,21 @@ class SharedDict(dict):
     burst -- a minion updating its states once per tick -- and turns that burst into a
     single encode and a single write. See `flush` for what the deferral does and does
     not change.
+
+    "Re-read on every access" is gated by the segment's generation counter: a refresh
+    that finds the counter where the last decode left it keeps the local copy instead
+    of reading and decoding again. See `_refresh` and `read_cache_stats`.
+
+    Single-key reads -- `get`, `d[key]`, `lookup` -- go one step further when the
+    counter has moved: they decode only the requested value, through the key directory
+    every publish writes behind the payload (see `lookup`). Whole-dict reads -- `keys`,
+    `items`, `copy` and the rest -- still decode the blob.
     """
 
     _BUFFER_PREFIX = 'b*'
 
-    def __init__(self, linked_memory_name: str, lock, *args, create=False, use_RWLock=True, size=2 ** 14, **kwargs):
+    def __init__(self, linked_memory_name: str, lock, *args, create=False, use_RWLock=True, size=2 ** 14,
+                 index=True, grow=False, **kwargs):
         """Create or attach to the backing `SharedBuffer` plus a paired generation-counter segment.
 
         `*args`/`**kwargs` seed the local dict via `dict.__init__` before the buffer is
@@ -904,6 +1938,16 @@ class SharedDict(dict):
         `self._pending`/`self._defer_writes`/etc. are initialized before the
         `SharedBuffer` is constructed so that any codepath reachable during construction
         which lands in `__setitem__` or `_refresh` finds them already in place.
+
+        `index` decides whether this handle's writes carry a key directory (item 31). It
+        is a writer-side choice only: a reader copes with either, falling back to a full
+        decode when the last write had none.
+
+        `grow` (off by default) lets the creating handle move the dict to a larger
+        segment when a write outgrows `size`, instead of the write failing (item 35, see
+        `SharedBuffer`). `size` then only sets the starting point. Peers follow the move on their next
+        read; the generation segment never moves, so the bump that follows the growing
+        write is what sends them there.
         """
         super().__init__(*args, **kwargs)
         # Before anything that can reach __setitem__ or _refresh.
@@ -911,12 +1955,23 @@ class SharedDict(dict):
         self._defer_writes = False
         self._generation_ctx = None
         self._generation_view = None
+        # The generation the local copy was last decoded at, or None when the local copy
+        # is not known to match any published state. See _refresh.
+        self._decoded_generation = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Values decoded one at a time by `lookup`, all valid at _key_cache_generation.
+        self._index = index
+        self._key_cache = {}
+        self._key_cache_generation = None
+        self._partial_reads = 0
         self._init_param = {"name": linked_memory_name,
                             "lock": lock,
                             "data": dict(self),
                             "create": create,
                             "use_RWLock": use_RWLock,
-                            "size": size}
+                            "size": size,
+                            "growable": create and grow}
         # self._linked_SharedBuffer = SharedBuffer(**self._init_param)
         self._linked_SharedBuffer = SharedBuffer(**self._init_param)
         self.is_alive = True
@@ -959,20 +2014,22 @@ class SharedDict(dict):
             self._pending[key] = value
             return
         try:
-            self._linked_SharedBuffer.write(dict(self))
-            self._bump_generation()
+            self._publish()
         except Exception:
             print(traceback.format_exc())
 
     def __getitem__(self, key):
-        """Refresh from shared memory, then return the local copy's value for `key`.
+        """Return the latest published value for `key`; KeyError if there is none.
 
-        Every read pays for a `_refresh()` (a `SharedBuffer.read` plus its retry loop),
-        so this reflects the latest state any peer has flushed rather than a stale
-        local copy -- at the cost of a shared-memory read on every single `d[key]`.
+        Every read reflects the latest state any peer has flushed rather than a stale
+        local copy. Since item 30 an unchanged generation costs one 4-byte compare, and
+        since item 31 a changed one costs a decode of this key's value only -- see
+        `lookup`.
         """
-        self._refresh()
-        return super().__getitem__(key)
+        found, value = self.lookup(key)
+        if not found:
+            raise KeyError(key)
+        return value
 
     def __repr__(self):
         """`dict.__repr__` of the local copy only -- deliberately does not refresh first."""
@@ -989,8 +2046,7 @@ class SharedDict(dict):
         if self._BUFFER_PREFIX in key.lower():
             raise Exception(f'The item [{key}] cannot be modified/deleted as it is linked with a buffer.')
         super().__delitem__(key)
-        self._linked_SharedBuffer.write(dict(self))
-        self._bump_generation()
+        self._publish()
 
     # def __del__(self):
     #     self.close()
@@ -1007,6 +2063,19 @@ class SharedDict(dict):
     def _refresh(self):
         """Pull the latest published state into the local dict, keeping deferred writes on top.
 
+        Skipped outright when the generation counter has not moved since the local copy
+        was last decoded (roadmap item 30). Every write path bumps the counter after its
+        payload lands, so an unchanged counter means an unchanged segment, and the local
+        copy is still exactly what a read would rebuild -- deferred writes included, since
+        `__setitem__` and `update` put those into the local copy as well as `_pending`.
+        That turns the common foreign poll, a peer that did not write this tick, into a
+        4-byte slice compare instead of a lock, a copy and a `json.loads` of the blob.
+
+        The generation is sampled *before* the read, never after. A write that lands
+        between the two leaves the cache keyed to the older value, so the next refresh
+        misses and reads again: the race can cost one redundant decode, never a stale hit.
+        A read that fails outright leaves the cache invalid for the same reason.
+
         Retries the underlying `SharedBuffer.read()` up to 10 times when it comes back
         None, since a reader can land mid-write and get a torn payload that fails to
         decode (see `SharedBuffer.write`'s note on writing length only after the
@@ -1018,6 +2087,12 @@ class SharedDict(dict):
         `_clear()` would otherwise make a deferred write invisible even to the process
         that made it, until it flushes.
         """
+        generation = self.generation
+        if generation == self._decoded_generation:
+            self._cache_hits += 1
+            return
+        self._cache_misses += 1
+        self._decoded_generation = None
         self._clear()
         data = None
         timeout = 10
@@ -1028,6 +2103,7 @@ class SharedDict(dict):
         if data is not None:
             try:
                 self._update(data)
+                self._decoded_generation = generation
             except:
                 print(traceback.format_exc())
         # Unflushed writes go back on top of what shared memory says. `_clear()` above
@@ -1084,8 +2160,7 @@ class SharedDict(dict):
             return False
         try:
             self._refresh()
-            self._linked_SharedBuffer.write(dict(self))
-            self._bump_generation()
+            self._publish()
             return True
         except Exception:
             print(traceback.format_exc())
@@ -1098,6 +2173,34 @@ class SharedDict(dict):
         """Whether any deferred writes are queued in `_pending`, waiting for `flush`."""
         return bool(self._pending)
 
+    def _publish(self):
+        """Write the whole local copy to the segment and bump the generation counter.
+
+        The read cache is dropped *first*, so it is dropped even when the write raises.
+        Every caller has already changed the local copy, and a write that fails leaves
+        the segment holding something else; a cache still keyed to the old generation
+        would then keep serving the unpublished value as if a peer could see it, where a
+        refresh used to discard it. Invalidating rather than re-keying to the new
+        generation also covers a peer writing between this write and its bump: this
+        process re-reads once after its own write, which is what it did before the cache.
+        """
+        self._decoded_generation = None
+        self._key_cache_generation = None
+        self._linked_SharedBuffer.write(dict(self), index=self._index)
+        self._bump_generation()
+
+    @property
+    def read_cache_stats(self):
+        """How often reads were answered without touching the segment, and how often not.
+
+        `hits` were answered from the local copy or the per-key cache, `misses` decoded
+        the whole blob, and `partial` decoded a single value through the key directory
+        (`lookup`). Per handle and per process: each peer attached to a segment keeps its
+        own copy and its own counts. Reads that track the writer's tick count rather
+        than the reader's poll count are the cache doing its job.
+        """
+        return {"hits": self._cache_hits, "misses": self._cache_misses, "partial": self._partial_reads}
+
     def _bump_generation(self):
         """Atomically increment this segment's change counter (item 14).
 
@@ -1142,13 +2245,55 @@ class SharedDict(dict):
         return super().get(key, default)
 
     def get(self, key):
-        """Refresh from shared memory, then return `dict.get(key)`.
+        """Return the latest published value for `key`, or None. See `lookup`.
 
         Narrower than `dict.get`: there is no `default` parameter, so a missing key
-        always returns None rather than a caller-supplied fallback.
-        """
-        self._refresh()
-        return super().get(key)
+        always returns None rather than a caller-supplied fallback. Use `lookup` to tell
+        a missing key from one holding None.
+        """
+        return self.lookup(key)[1]
+
+    def lookup(self, key):
+        """Return `(found, value)` for one key, decoding no more than that key (item 31).
+
+        The answer is what a full refresh followed by a dict lookup would give, reached
+        more cheaply:
+
+        - a key with an unflushed deferred write answers with that value, as `_refresh`
+          would have put it back on top;
+        - an unchanged generation answers from the local copy (item 30);
+        - otherwise the value is decoded alone through `SharedBuffer.read_key`, and
+          remembered per generation so a second poll of the same key before the next
+          write is free as well.
+
+        The local copy is deliberately left alone on the partial path -- it would then
+        hold one fresh key among stale ones -- and the full-decode cache stays keyed to
+        the generation it was built at. Only when the segment has no usable directory
+        does this fall back to a full `_refresh`.
+
+        Why it matters: a foreign poll wants one state, `get_foreign_state`'s single
+        key, but the blob holds every state the peer owns. On a 1000-key dict the full
+        decode cost grows with the key count; the directory lookup does not.
+        """
+        if key in self._pending:
+            return True, self._pending[key]
+        generation = self.generation
+        if generation == self._decoded_generation:
+            self._cache_hits += 1
+            return super().__contains__(key), super().get(key)
+        if generation == self._key_cache_generation and key in self._key_cache:
+            self._cache_hits += 1
+            return self._key_cache[key]
+        result = self._linked_SharedBuffer.read_key(key)
+        if result is None:
+            self._refresh()
+            return super().__contains__(key), super().get(key)
+        self._partial_reads += 1
+        if generation != self._key_cache_generation:
+            self._key_cache = {}
+            self._key_cache_generation = generation
+        self._key_cache[key] = result
+        return result
 
     def update(self, D: dict, **kwargs):
         """Merge several keys with one write.
@@ -1164,8 +2309,7 @@ class SharedDict(dict):
         if self._defer_writes:
             self._pending.update(payload)
             return
-        self._linked_SharedBuffer.write(dict(self))
-        self._bump_generation()
+        self._publish()
 
     def clear(self, clear_buffer=False):
         """Clear the local copy; only touches the shared segment when `clear_buffer=True`.
@@ -1176,9 +2320,11 @@ class SharedDict(dict):
         that mismatch does not pass silently.
         """
         self._clear()
+        # The local copy no longer matches any published generation, so the next
+        # refresh must read -- or the cache would serve this empty dict as current.
+        self._decoded_generation = None
         if clear_buffer:
-            self._linked_SharedBuffer.write(dict(self))
-            self._bump_generation()
+            self._publish()
         else:
             warnings.warn('SharedDict.clear() only clear its local dictionary items but not the linked shared buffer.\n'
                           'Set clear_buffer to True in order to clear the linked buffer')
@@ -1187,16 +2333,14 @@ class SharedDict(dict):
         """Refresh, remove `key` from the local copy, and push the result to shared memory."""
         self._refresh()
         val = super().pop(key)
-        self._linked_SharedBuffer.write(dict(self))
-        self._bump_generation()
+        self._publish()
         return val
 
     def popitem(self):
         """Refresh, remove an arbitrary item from the local copy, and push the result to shared memory."""
         self._refresh()
         val = super().popitem()
-        self._linked_SharedBuffer.write(dict(self))
-        self._bump_generation()
+        self._publish()
         return val
 
     def copy(self):
@@ -1250,8 +2394,7 @@ class SharedDict(dict):
         """
         if self._BUFFER_PREFIX in key:
             super().__delitem__(key)
-            self._linked_SharedBuffer.write(dict(self))
-            self._bump_generation()
+            self._publish()
             print(f'The link to the buffer [{key}] has been closed')
         else:
             raise Exception(f'The buffer [{key}] cannot be found.')
@@ -386,7 +386,7 @@ class BaseMinion:
             else:
                 sleep(0.1)
 
-    def create_shared_buffer(self, name, data, dtype=None):
+    def create_shared_buffer(self, name, data, dtype=None, mode='locked', history=None):
         """Back a new shared state with a `SharedNdarray` instead of the SharedDict.
 
         Used by `create_state(..., use_buffer=True)` for values that need
@@ -396,6 +396,16 @@ class BaseMinion:
         normal `get_state` transparently follow it via `_read_buffer_as_state`.
         Scalars and list/tuple inputs are coerced to a 1-element/1-D `ndarray`
         first, since `SharedNdarray` only stores arrays.
+
+        `mode='latest'` (item 32) suits a buffer with one producer whose readers only
+        want its newest value -- a camera frame, a render preview: writes stop waiting
+        on readers' copies. Peers need nothing different; attaching reads the mode from
+        the segment header.
+
+        `history=N` (item 33) backs the state with a `SharedRing` of N samples instead,
+        each shaped like `data`. To everything that reads or writes the state as usual it
+        looks the same -- a write appends, a read returns the newest sample -- while
+        `get_state_since` returns every sample a reader has not seen yet.
         """
         # The reference name of any shared buffer should have the structure 'b*{minion_name}_{buffer_name}' The
         # builtin state dictionary for all minions are the SharedDict whose name is 'b*{self.name}_shared_dict'
@@ -418,8 +428,12 @@ class BaseMinion:
         if name not in self._shared_dict.keys():
             shared_buffer_name = f"{self.name}_{name}"
             try:
-                self._shared_buffer[f"b*{shared_buffer_name}"] = SharedNdarray(shared_buffer_name, self.lock,
-                                                                               data)  # The list '_shared_buffer" host all local buffer for other minion to access, it also serves as a handle hub for later closing these buffers
+                if history is not None:
+                    self._shared_buffer[f"b*{shared_buffer_name}"] = SharedRing(shared_buffer_name, self.lock, data,
+                                                                                capacity=history)
+                else:
+                    self._shared_buffer[f"b*{shared_buffer_name}"] = SharedNdarray(shared_buffer_name, self.lock,
+                                                                                   data, mode=mode)  # The list '_shared_buffer" host all local buffer for other minion to access, it also serves as a handle hub for later closing these buffers
             except Exception:
                 self.log(logging.ERROR, f"Error in creating buffer '{name}'.\n{traceback.format_exc()}")
             self._shared_dict[
@@ -477,7 +491,7 @@ class BaseMinion:
                     self._registered_buffer_handle[minion_name] = {}
                     for k in self._linked_minion[minion_name]:
                         if k != 'shared_dict':
-                            buf = SharedNdarray(f"{minion_name}_{k}", lock=self.lock, create=False)
+                            buf = open_shared_buffer(f"{minion_name}_{k}", lock=self.lock)
                         else:
                             buf = SharedDict(f"{minion_name}_shared_dict", lock=self.lock, create=False)
                         self._registered_buffer_handle[minion_name][k] = buf
@@ -492,7 +506,8 @@ class BaseMinion:
             self.log(logging.INFO, f"Already linked to minion: {minion_name}")
         return err
 
-    def create_state(self, state_name: str, state_val: object, use_buffer: bool = False, dtype=None):
+    def create_state(self, state_name: str, state_val: object, use_buffer: bool = False, dtype=None,
+                     history=None):
         """Declare a new shared state, dict-backed by default or buffer-backed when `use_buffer`.
 
         Refuses to overwrite an existing state of the same name (logs an error and
@@ -500,12 +515,15 @@ class BaseMinion:
         boundary -- see the inline note on the dict branch -- because peers
         discover new states by polling for them, and a declaration is expected to
         happen once at startup, so the extra write is free in steady state.
+
+        `history=N` keeps the last N values in a shared ring (see
+        `create_shared_buffer`); it implies `use_buffer`.
         """
         if state_name in self._shared_dict.keys():
             self.log(logging.ERROR, f"State '{state_name}' already exists")
         else:
-            if use_buffer:
-                self.create_shared_buffer(state_name, state_val, dtype=dtype)
+            if use_buffer or history is not None:
+                self.create_shared_buffer(state_name, state_val, dtype=dtype, history=history)
             else:
                 self._shared_dict[state_name] = state_val
                 # A declaration is published immediately, never deferred to the tick
@@ -650,15 +668,19 @@ class BaseMinion:
                     # up on the second attempt, and then reported it as unknown while
                     # returning the value it had just read.
                     err_code = 0
-                    if state_name in shared_dict.keys():
-                        state_val = shared_dict[state_name]
+                    # One key, so one value decoded through the peer's key directory
+                    # (item 31) rather than a `keys()` refresh of its whole blob.
+                    found, state_val = shared_dict.lookup(state_name)
+                    if found:
                         if type(state_val) == str:
                             if state_val.startswith(_contract.BUFFER_PREFIX):
                                 self._linked_minion[minion_name].append(state_name)
-                                self._registered_buffer_handle[minion_name][state_name] = SharedNdarray(f"{minion_name}_{state_name}", lock=self.lock, create=False)
+                                self._registered_buffer_handle[minion_name][state_name] = open_shared_buffer(f"{minion_name}_{state_name}", lock=self.lock)
                                 state_val = self._read_foreign_buffer_as_state(minion_name, state_name, asis)
                     elif state_name == 'ALL':
-                        state_val = dict(shared_dict)
+                        # `copy()` refreshes; `dict(shared_dict)` copies the local dict
+                        # storage directly and used to rely on the `keys()` call above.
+                        state_val = shared_dict.copy()
                         for i_state_name, i_state_val in state_val.items():
                             if type(i_state_val) == str:
                                 if i_state_val.startswith(_contract.BUFFER_PREFIX):
@@ -700,6 +722,72 @@ class BaseMinion:
 
         return state_val
 
+    def get_state_since(self, minion_name: str, state_name: str, cursor=None):
+        """Every value a history state took since `cursor`, and the cursor to pass next time.
+
+        Returns `(samples, cursor)` from `SharedRing.read_since`: `samples` is one array,
+        oldest first, shaped `(k, *sample_shape)`. Each caller keeps its own cursor, so any
+        number of readers can consume a state's full-rate stream independently. Start
+        with `cursor=None` for everything still retained. Works on this minion's own
+        states and on a linked peer's; a peer's ring is discovered through
+        `get_foreign_state` the first time, like any other buffer-backed state.
+
+        Returns `(None, cursor)`, with an error logged, for a state that was not created
+        with `history=N`.
+        """
+        ring = self._buffer_handle(minion_name, state_name)
+        if not isinstance(ring, SharedRing):
+            self.error(f"State '{state_name}' of minion '{minion_name}' keeps no history; "
+                       f"create it with history=N")
+            return None, cursor
+        return ring.read_since(cursor)
+
+    def get_state_into(self, minion_name: str, state_name: str, out):
+        """Copy a buffer-backed state into the caller's preallocated `out`, and return it.
+
+        `SharedNdarray.read_into` behind the usual state lookup: the same value
+        `get_state_from(..., asis=True)` would give, without a new array per call (item
+        34). Meant for a preview or recorder reading a large frame every tick into one
+        array it keeps. Returns None, with an error logged, for a state that is not
+        backed by a `SharedNdarray`.
+        """
+        buffer = self._buffer_handle(minion_name, state_name)
+        if not isinstance(buffer, SharedNdarray):
+            self.error(f"State '{state_name}' of minion '{minion_name}' is not an array buffer")
+            return None
+        return buffer.read_into(out)
+
+    def borrow_state(self, minion_name: str, state_name: str):
+        """A zero-copy, read-only view of a buffer-backed state; see `SharedNdarray.borrow`.
+
+        Check the borrow's `valid` after using its `array` and discard the work if it is
+        False. Returns None, with an error logged, for a state that is not backed by a
+        `SharedNdarray`.
+        """
+        buffer = self._buffer_handle(minion_name, state_name)
+        if not isinstance(buffer, SharedNdarray):
+            self.error(f"State '{state_name}' of minion '{minion_name}' is not an array buffer")
+            return None
+        return buffer.borrow()
+
+    def _buffer_handle(self, minion_name, state_name):
+        """The open buffer behind a buffer-backed state of this minion or a linked peer, or None.
+
+        A peer's state is resolved through `get_foreign_state` the first time, which
+        opens and caches the handle exactly as an ordinary read would.
+        """
+        if minion_name == self.name:
+            reference = self._shared_dict.local_get(state_name)
+            if type(reference) == str and reference.startswith(_contract.BUFFER_PREFIX):
+                return self._shared_buffer.get(reference)
+            return None
+        if minion_name in self._linked_minion.keys():
+            if state_name not in self._linked_minion[minion_name]:
+                self.get_foreign_state(minion_name, state_name)
+            return self._registered_buffer_handle.get(minion_name, {}).get(state_name)
+        self.error(f"Unknown minion: '{minion_name}'")
+        return None
+
     def _read_foreign_buffer_as_state(self, minion_name, state_name, asis):
         """Read a peer's buffer-backed state, unwrapping a 1-element array to a scalar unless `asis`."""
         shm = self._registered_buffer_handle[minion_name][state_name]
@@ -807,8 +895,8 @@ class BaseMinion:
                     if type(stored_val) == str:
                         if stored_val.startswith(_contract.BUFFER_PREFIX):
                             self._linked_minion[minion_name].append(state_name)
-                            self._registered_buffer_handle[minion_name][state_name] = SharedNdarray(
-                                f"{minion_name}_{state_name}", lock=self.lock, create=False)
+                            self._registered_buffer_handle[minion_name][state_name] = open_shared_buffer(
+                                f"{minion_name}_{state_name}", lock=self.lock)
                             state_type = 'buffer'
                     if state_type == "dict_val":
                         shared_dict[state_name] = state_val
@@ -1020,6 +1108,24 @@ class BaseMinion:
         except Exception:
             return None
 
+    def read_cache_stats(self):
+        """Read-cache counters for this minion's own SharedDict and every linked peer's (item 30).
+
+        Keyed by minion name; each value is that handle's `SharedDict.read_cache_stats`.
+        Local to this process -- a peer's handle on the same segment counts separately --
+        so calling it on two minions answers two different questions: the owner's entry
+        says how often its own `get_state` re-read, a reader's entry for the owner says how
+        often polling that owner actually decoded anything.
+        """
+        stats = {}
+        if self._shared_dict is not None:
+            stats[self.name] = self._shared_dict.read_cache_stats
+        for minion_name, handles in self._registered_buffer_handle.items():
+            shared_dict = handles.get('shared_dict')
+            if shared_dict is not None:
+                stats[minion_name] = shared_dict.read_cache_stats
+        return stats
+
     def is_buffer_alive(self, minion_name, buffer_name):
         """
         Determine the states of connected foreign shared buffer
@@ -1037,8 +1143,8 @@ class BaseMinion:
             else:
                 # 2. update the registered buffer handle
                 if buffer_name not in self._registered_buffer_handle[minion_name].keys():
-                    self._registered_buffer_handle[minion_name][buffer_name] = SharedNdarray(
-                        f"{minion_name}_{buffer_name}", lock=self.lock, create=False)
+                    self._registered_buffer_handle[minion_name][buffer_name] = open_shared_buffer(
+                        f"{minion_name}_{buffer_name}", lock=self.lock)
             try:
                 ISALIVE = self._registered_buffer_handle[minion_name][buffer_name].is_alive()
                 return ISALIVE
@@ -1445,9 +1551,9 @@ class AbstractMinionMixin:
         """Names of every shared state exposed by `minion_name`."""
         return list(self._processHandler.get_shared_state_names(minion_name))
 
-    def create_state(self, state_name, state_val, use_buffer=False, dtype=None):
+    def create_state(self, state_name, state_val, use_buffer=False, dtype=None, history=None):
         """Declare a new shared state on the wrapped minion; see `BaseMinion.create_state`."""
-        self._processHandler.create_state(state_name, state_val, use_buffer, dtype)
+        self._processHandler.create_state(state_name, state_val, use_buffer, dtype, history=history)
 
     def remove_state(self, state_name):
         """Delete a shared state from the wrapped minion."""
@@ -1469,9 +1575,21 @@ class AbstractMinionMixin:
         """Read a state from `minion_name` (self or a linked peer); see `BaseMinion.get_state_from`."""
         return self._processHandler.get_state_from(minion_name, state_name)
 
-    def create_shared_buffer(self, buffer_name, buffer_val):
+    def get_state_since(self, minion_name, state_name, cursor=None):
+        """Every value of a history state since `cursor`; see `BaseMinion.get_state_since`."""
+        return self._processHandler.get_state_since(minion_name, state_name, cursor)
+
+    def get_state_into(self, minion_name, state_name, out):
+        """Copy a buffer-backed state into `out`; see `BaseMinion.get_state_into`."""
+        return self._processHandler.get_state_into(minion_name, state_name, out)
+
+    def borrow_state(self, minion_name, state_name):
+        """A zero-copy view of a buffer-backed state; see `BaseMinion.borrow_state`."""
+        return self._processHandler.borrow_state(minion_name, state_name)
+
+    def create_shared_buffer(self, buffer_name, buffer_val, mode='locked'):
         """Back a new state on the wrapped minion with a shared buffer; see `BaseMinion.create_shared_buffer`."""
-        self._processHandler.create_shared_buffer(buffer_name, buffer_val)
+        self._processHandler.create_shared_buffer(buffer_name, buffer_val, mode=mode)
 
     def remove_shared_buffer(self, buffer_name):
         """Remove a shared buffer from the wrapped minion."""
@@ -1501,6 +1619,10 @@ class AbstractMinionMixin:
         """The wrapped minion's current status value."""
         return self._processHandler.status
 
+    def read_cache_stats(self):
+        """The wrapped minion's per-segment read-cache counters; see `BaseMinion.read_cache_stats`."""
+        return self._processHandler.read_cache_stats()
+
 
 class TimerMinionMixin(AbstractMinionMixin):
     """AbstractMinionMixin variant for compilers wrapping a `TimerMinion`, exposing its named-timer API."""
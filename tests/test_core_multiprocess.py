@@ -37,13 +37,17 @@ from time import perf_counter, sleep
 
 import numpy as np
 
-from miniPoly.core.buffer import SharedBuffer, SharedDict
+from miniPoly.core.buffer import (SharedBuffer, SharedDict, SharedNdarray, SharedRing, _encode, _encode_indexed,
+                                  open_shared_buffer)
 from miniPoly.core.minion import SHAREDLOCK
 
 N_PROC = 3
 N_ITER = 300
 JOIN_TIMEOUT = 20.0
 SEGMENT_SIZE = 2 ** 13
+# A quarter-megabyte frame: large enough that a copy takes long enough to overlap a
+# write, small enough that a few hundred of them stay well inside the time budget.
+FRAME_SHAPE = (64, 1024)
 
 # Defects reproduced on purpose. Remove an entry here only together with its fix.
 # Graduated: "B1-failed-encode-wipes-and-locks-the-segment" was fixed by roadmap
@@ -166,6 +170,141 @@ def _w_create_attach_then_die(name, ready_seg):
     os._exit(0)
 
 
+def _w_frame_writer(seg, result_seg, n_frames):
+    """Publish frames 1..n_frames, each filled with its own number, timing every write.
+
+    Writer row of the result block: [done, frames, total write s, max write s].
+    """
+    buf = SharedNdarray(seg, lock=SHAREDLOCK, create=False)
+    result = shared_memory.SharedMemory(name=result_seg)
+    table = np.ndarray((result.size // 48, 6), dtype=np.float64, buffer=result.buf)
+    frame = np.empty(buf.shape, dtype=np.uint32)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for i in range(1, n_frames + 1):
+                frame.fill(i)
+                t0 = perf_counter()
+                buf.write(frame)
+                elapsed = perf_counter() - t0
+                table[0, 2] += elapsed
+                table[0, 3] = max(table[0, 3], elapsed)
+                table[0, 1] = i
+    finally:
+        table[0, 0] = 1
+        del table
+        result.close()
+        buf.close()
+
+
+def _w_frame_reader(seg, result_seg, row):
+    """Copy frames until the writer is done, classifying each one.
+
+    A frame is torn when its elements disagree -- part of it is one write and part
+    another -- and dropped when its number skips past the previous one read. In
+    'latest' mode `last_read_frame` must also name the frame actually returned (the
+    writer's frame i is the segment's frame i + 1, since creation wrote frame 1).
+    Reader row: [ready, reads, torn, dropped, went backwards, frame number wrong].
+    """
+    buf = SharedNdarray(seg, lock=SHAREDLOCK, create=False)
+    result = shared_memory.SharedMemory(name=result_seg)
+    table = np.ndarray((result.size // 48, 6), dtype=np.float64, buffer=result.buf)
+    last = 0
+    try:
+        table[row, 0] = 1
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            while table[0, 0] == 0:
+                data = buf.read()
+                if data is None:
+                    continue
+                table[row, 1] += 1
+                value = int(data.flat[0])
+                if not (data == value).all():
+                    table[row, 2] += 1
+                    continue
+                if value < last:
+                    table[row, 4] += 1
+                elif value > last + 1:
+                    table[row, 3] += value - last - 1
+                last = max(last, value)
+                if buf.mode == "latest" and buf.last_read_frame != value + 1:
+                    table[row, 5] += 1
+    finally:
+        del table
+        result.close()
+        buf.close()
+
+
+def _w_ring_writer(seg, done_seg, n_samples):
+    """Append samples 1..n_samples, each four copies of its own number, mostly one by one.
+
+    Every tenth step appends a block of three instead, so `extend`'s single publish is
+    exercised alongside `write`.
+    """
+    ring = open_shared_buffer(seg, SHAREDLOCK)
+    done = shared_memory.SharedMemory(name=done_seg)
+    try:
+        i = 1
+        while i <= n_samples:
+            if i % 10 == 0 and i + 2 <= n_samples:
+                ring.extend(np.repeat(np.arange(i, i + 3, dtype=np.float64)[:, None], 4, axis=1))
+                i += 3
+            else:
+                ring.write(np.full(4, i, dtype=np.float64))
+                i += 1
+    finally:
+        done.buf[0] = 1
+        done.close()
+        ring.close()
+
+
+def run_frame_handoff(mode, n_frames=200, n_readers=2):
+    """One writer publishing frames while `n_readers` peers copy them continuously.
+
+    Shared by the contract check and by `--perf`. Returns the writer's timings and
+    the readers' summed counts, or None for the counts if a process hung.
+    """
+    seg, result_seg = f"mp_frames_{mode}", f"mp_frames_{mode}_result"
+    _unlink_quietly(seg)
+    _unlink_quietly(result_seg)
+    owner = SharedNdarray(seg, lock=SHAREDLOCK, data=np.zeros(FRAME_SHAPE, dtype=np.uint32), mode=mode)
+    result = shared_memory.SharedMemory(create=True, name=result_seg, size=48 * (1 + n_readers))
+    table = np.ndarray((1 + n_readers, 6), dtype=np.float64, buffer=result.buf)
+    table[:] = 0
+    procs = []
+    try:
+        for row in range(1, n_readers + 1):
+            procs.append(mp.Process(target=_w_frame_reader, args=(seg, result_seg, row)))
+            procs[-1].start()
+        deadline = perf_counter() + JOIN_TIMEOUT
+        while not table[1:, 0].all() and perf_counter() < deadline:
+            sleep(0.01)
+        procs.append(mp.Process(target=_w_frame_writer, args=(seg, result_seg, n_frames)))
+        procs[-1].start()
+        for p in procs:
+            p.join(timeout=max(0.1, deadline - perf_counter()))
+        stuck = [p for p in procs if p.is_alive()]
+        for p in stuck:
+            p.terminate()
+            p.join(timeout=2.0)
+        frames = int(table[0, 1])
+        out = {
+            "hung": len(stuck),
+            "frames": frames,
+            "write mean (us)": table[0, 2] / max(frames, 1) * 1e6,
+            "write max (us)": table[0, 3] * 1e6,
+        }
+        for col, label in ((1, "reads"), (2, "torn"), (3, "dropped"), (4, "backwards"), (5, "frame mismatch")):
+            out[label] = int(table[1:, col].sum())
+        return out
+    finally:
+        del table
+        result.close()
+        result.unlink()
+        owner.terminate()
+
+
 # --------------------------------------------------------------------------
 # contract checks
 # --------------------------------------------------------------------------
@@ -504,6 +643,360 @@ def check_generation_counter_tracks_every_write():
     return problems
 
 
+def check_generation_gates_the_read_cache():
+    """A refresh reads the segment only when its generation has moved (item 30).
+
+    Five properties. The first is the point of the item: a peer polling a segment
+    nobody wrote to must not touch the blob at all. The rest are the ways a cache keyed
+    on a counter can go stale -- a write from another process, a write from this
+    handle that failed, a local `clear()` -- each of which must force a real read.
+    """
+    problems = []
+    seg, done_seg = "mp_cache_dict", "mp_cache_done"
+    _unlink_quietly(seg)
+    _unlink_quietly(done_seg)
+    done = shared_memory.SharedMemory(create=True, name=done_seg, size=8)
+    done.buf[0] = 0
+    owner = SharedDict(seg, lock=SHAREDLOCK, create=True, size=SEGMENT_SIZE)
+    peer = None
+    try:
+        owner.update({"name": "SCAN", "timestamp": 1.0})
+        peer = SharedDict(seg, lock=SHAREDLOCK)
+        reads = []
+        real_read = peer._linked_SharedBuffer.read
+
+        def counting_read():
+            reads.append(1)
+            return real_read()
+
+        peer._linked_SharedBuffer.read = counting_read
+
+        # 1. Unchanged segment: one read for the first full poll, none for the next
+        #    hundred. The opening `get` decodes its one value through the key directory
+        #    (item 31), so it is counted as `partial`, not as a read of the blob.
+        peer.get("timestamp")
+        for _ in range(100):
+            if "timestamp" in peer.keys():
+                peer["timestamp"]
+        if len(reads) != 1:
+            problems.append(f"{len(reads)} reads for 201 refreshes of an unchanged segment, "
+                            f"expected 1")
+        stats = peer.read_cache_stats
+        if stats != {"hits": 199, "misses": 1, "partial": 1}:
+            problems.append(f"read_cache_stats reported {stats}, expected 199 hits / 1 miss / 1 partial")
+
+        # 2. The owner's write is seen on the very next refresh.
+        owner["timestamp"] = 2.0
+        if peer.get("timestamp") != 2.0:
+            problems.append(f"an owner write was served from the cache: {peer.get('timestamp')!r}")
+
+        # 3. So is a write from a third process.
+        exitcodes, stragglers = _spawn(_w_write_one_key, (seg, "timestamp", 3.0, done_seg), n=1)
+        if done.buf[0] != 1 or stragglers:
+            problems.append(f"the foreign writer did not complete (exitcodes={exitcodes})")
+        elif peer.get("timestamp") != 3.0:
+            problems.append(f"a foreign write was served from the cache: {peer.get('timestamp')!r}")
+
+        # 4. A write this handle could not publish must not survive as a cache hit.
+        with warnings.catch_warnings(), redirect_stdout(io.StringIO()):
+            warnings.simplefilter("ignore")
+            peer["bad"] = np.arange(3)
+        if peer.get("bad") is not None:
+            problems.append("a value that never reached shared memory was served from the cache")
+
+        # 5. Nor may a local clear().
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            peer.clear()
+        if peer.get("timestamp") != 3.0:
+            problems.append("clear() of the local copy was served from the cache as the segment")
+    finally:
+        for handle in (peer, owner):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        done.close()
+        done.unlink()
+        _unlink_quietly(seg)
+    return problems
+
+
+def check_key_directory_decodes_one_value():
+    """A single-key read decodes that value alone, and never a wrong one (item 31).
+
+    The directory is a second description of the payload, so the checks are mostly
+    about the two disagreeing: a payload that must stay byte-identical for whole-blob
+    readers, a directory that did not fit, a later write that carried none, a key that
+    is absent versus one that holds None. In every such case the answer must be what a
+    full decode would have given.
+    """
+    problems = []
+    seg, small_seg, done_seg = "mp_index_dict", "mp_index_small", "mp_index_done"
+    for name in (seg, small_seg, done_seg):
+        _unlink_quietly(name)
+    done = shared_memory.SharedMemory(create=True, name=done_seg, size=8)
+    done.buf[0] = 0
+    owner = SharedDict(seg, lock=SHAREDLOCK, create=True, size=2 ** 16)
+    handles = [owner]
+    try:
+        data = {f"key_{i:04d}": i * 0.5 for i in range(1000)}
+        data["none"] = None
+        data["nested"] = {"a": [1, 2, {"b": "c, d: e"}], "é": "ü"}
+        owner.update(data)
+        peer = SharedDict(seg, lock=SHAREDLOCK)
+        handles.append(peer)
+        reads = []
+        real_read = peer._linked_SharedBuffer.read
+
+        def counting_read():
+            reads.append(1)
+            return real_read()
+
+        peer._linked_SharedBuffer.read = counting_read
+
+        # 1. The payload whole-blob readers see is exactly what `_encode` produces, for
+        #    every path the indexed encoder splits values into.
+        mixed = {"int": 1, "nan": float("nan"), "sep": "x, y: z", "é": "ü", "none": None,
+                 "bool": True, "list": [1, "a, b"], "f32": np.float32(1.5), "big": 10 ** 30}
+        if _encode_indexed(mixed)[0] != _encode(mixed):
+            problems.append("an indexed payload is not byte-identical to the plain encoding")
+        if real_read() != json.loads(json.dumps(data)):
+            problems.append("an indexed payload does not decode to the dict that was written")
+
+        # 2. Every kind of value comes back, and none of them decodes the blob.
+        for key in ("key_0000", "key_0999", "key_0500", "nested"):
+            if peer.get(key) != data[key]:
+                problems.append(f"get({key!r}) returned {peer.get(key)!r}")
+        if peer.lookup("none") != (True, None):
+            problems.append(f"a key holding None looked up as {peer.lookup('none')!r}")
+        if peer.lookup("missing") != (False, None):
+            problems.append(f"an absent key looked up as {peer.lookup('missing')!r}")
+        try:
+            peer["missing"]
+            problems.append("d['missing'] did not raise KeyError")
+        except KeyError:
+            pass
+        if reads:
+            problems.append(f"{len(reads)} whole-blob reads for single-key lookups, expected 0")
+
+        # 3. A foreign write lands in the directory as well as in the payload.
+        exitcodes, stragglers = _spawn(_w_write_one_key, (seg, "key_0007", -1.0, done_seg), n=1)
+        if done.buf[0] != 1 or stragglers:
+            problems.append(f"the foreign writer did not complete (exitcodes={exitcodes})")
+        elif peer.get("key_0007") != -1.0:
+            problems.append(f"a foreign write was not seen through the directory: {peer.get('key_0007')!r}")
+
+        # 4. A write without a directory must not leave the previous one in charge.
+        #    The stale directory would still point key_0001 at valid-looking bytes.
+        unindexed = SharedDict(seg, lock=SHAREDLOCK, index=False)
+        handles.append(unindexed)
+        unindexed.update({"key_0001": "rewritten"})
+        reads.clear()
+        if peer.get("key_0001") != "rewritten":
+            problems.append(f"a directory outlived the write that replaced it: {peer.get('key_0001')!r}")
+        if len(reads) != 1:
+            problems.append(f"{len(reads)} whole-blob reads after an unindexed write, expected 1")
+
+        # 5. A directory that does not fit is dropped, never the write.
+        small = SharedDict(small_seg, lock=SHAREDLOCK, create=True, size=512)
+        handles.append(small)
+        small_data = {f"k{i}": "x" * 20 for i in range(14)}
+        small.update(small_data)
+        small_peer = SharedDict(small_seg, lock=SHAREDLOCK)
+        handles.append(small_peer)
+        if small_peer.get("k13") != "x" * 20 or small_peer.read_cache_stats["partial"]:
+            problems.append("a segment too small for its directory was not read in full")
+    finally:
+        for handle in reversed(handles):
+            try:
+                handle.close()
+            except Exception:
+                pass
+        done.close()
+        done.unlink()
+        _unlink_quietly(seg)
+        _unlink_quietly(small_seg)
+    return problems
+
+
+def check_latest_mode_never_tears_a_frame():
+    """'latest' mode hands every reader a whole, current frame (item 32).
+
+    Counted across real processes: one writer publishing as fast as it can, two
+    readers copying as fast as they can. Torn frames must be zero and frames must
+    never go backwards. Dropped frames are expected -- a reader that falls behind
+    skips to the newest -- so they are reported by `--perf`, not asserted. Also pins
+    that an attaching handle takes the mode from the header, not from its caller.
+    """
+    problems = []
+    seg = "mp_frames_attach"
+    _unlink_quietly(seg)
+    owner = SharedNdarray(seg, lock=SHAREDLOCK, data=np.arange(4.0), mode="latest")
+    try:
+        peer = SharedNdarray(seg, lock=SHAREDLOCK, create=False)
+        if peer.mode != "latest" or not np.array_equal(peer.read(), np.arange(4.0)):
+            problems.append(f"an attaching handle read mode={peer.mode!r}, data={peer.read()!r}")
+        with warnings.catch_warnings(), redirect_stdout(io.StringIO()):
+            warnings.simplefilter("ignore")
+            try:
+                owner.write(np.zeros(3))
+            except Exception:
+                pass
+        owner.write(np.ones(4))
+        if not np.array_equal(peer.read(), np.ones(4)) or peer.last_read_frame != peer.frame:
+            problems.append("a write after a failed one was not published as the newest frame")
+        peer.close()
+    finally:
+        owner.terminate()
+
+    out = run_frame_handoff("latest")
+    if out["hung"]:
+        problems.append(f"{out['hung']} frame worker(s) hung")
+    elif out["frames"] == 0 or out["reads"] == 0:
+        problems.append(f"nothing was exchanged: {out}")
+    else:
+        for key in ("torn", "backwards", "frame mismatch"):
+            if out[key]:
+                problems.append(f"{out[key]} {key} frame(s) in {out['reads']} reads")
+    return problems
+
+
+def check_borrowed_reads_detect_overwrites():
+    """`read_into` fills the caller's array; a borrow knows when a write reached it (item 34).
+
+    In both modes: `read_into` returns the array it was given, with the segment's
+    contents; a borrowed view is read-only and starts out valid; a write the view
+    could have observed makes it invalid. 'latest' mode has one more property worth
+    pinning, because it is the reason a borrow there is useful at all -- the writer does
+    not reach the borrowed slot until its third write, so one intervening frame leaves
+    the borrow valid. A failed write must not leave 'locked' mode's sequence odd.
+    """
+    problems = []
+    for mode in ("locked", "latest"):
+        seg = f"mp_borrow_{mode}"
+        _unlink_quietly(seg)
+        owner = SharedNdarray(seg, lock=SHAREDLOCK, data=np.zeros((4, 3)), mode=mode)
+        peer = SharedNdarray(seg, lock=SHAREDLOCK, create=False)
+        try:
+            owner.write(np.full((4, 3), 7.0))
+            out = np.empty((4, 3))
+            if peer.read_into(out) is not out or not (out == 7.0).all():
+                problems.append(f"{mode}: read_into did not fill and return the caller's array")
+            with peer.borrow() as borrowed:
+                if borrowed.array.flags.writeable:
+                    problems.append(f"{mode}: a borrowed view is writable")
+                if not borrowed.valid or not (borrowed.array == 7.0).all():
+                    problems.append(f"{mode}: a fresh borrow is not valid, or not the current array")
+                owner.write(np.full((4, 3), 8.0))
+                if mode == "latest":
+                    if not borrowed.valid:
+                        problems.append("latest: one write invalidated a borrow of the previous slot")
+                    owner.write(np.full((4, 3), 9.0))
+                    owner.write(np.full((4, 3), 10.0))
+                if borrowed.valid:
+                    problems.append(f"{mode}: a borrow stayed valid after a write reached its array")
+            if borrowed.array is not None:
+                problems.append(f"{mode}: the view outlived its with block")
+            with warnings.catch_warnings(), redirect_stdout(io.StringIO()):
+                warnings.simplefilter("ignore")
+                try:
+                    owner.write(np.zeros(5))
+                except Exception:
+                    pass
+                with peer.borrow(timeout=10) as borrowed:
+                    if not borrowed.valid:
+                        problems.append(f"{mode}: a failed write left the segment looking mid-write")
+        finally:
+            peer.close()
+            owner.terminate()
+    return problems
+
+
+def check_ring_delivers_every_sample():
+    """A history state hands each reader every sample it has not seen yet (item 33).
+
+    First in-process, where the outcome is exact: ten writes between two polls come
+    back as ten samples, and samples the ring has already overwritten are counted as
+    overruns rather than returned. Then across processes, with a writer appending as
+    fast as it can while this process polls: every sample returned must be whole and
+    must follow the one before it, unless an overrun accounts for the gap, and
+    returned plus overrun must cover everything written.
+    """
+    problems = []
+    seg, done_seg = "mp_ring", "mp_ring_done"
+    _unlink_quietly(seg)
+    _unlink_quietly(done_seg)
+
+    ring = SharedRing(seg, SHAREDLOCK, np.zeros(4), capacity=16)
+    try:
+        peer = open_shared_buffer(seg, SHAREDLOCK)
+        if not isinstance(peer, SharedRing):
+            problems.append(f"open_shared_buffer attached a ring as {type(peer).__name__}")
+        cursor = peer.cursor
+        for i in range(1, 11):
+            ring.write(np.full(4, i))
+        samples, cursor = peer.read_since(cursor)
+        if samples[:, 0].tolist() != list(range(1, 11)):
+            problems.append(f"ten writes between polls came back as {samples[:, 0].tolist()}")
+        if not np.array_equal(peer.read(), np.full(4, 10)):
+            problems.append(f"read() did not return the newest sample: {peer.read()!r}")
+        for i in range(11, 41):
+            ring.write(np.full(4, i))
+        samples, cursor = peer.read_since(cursor)
+        if samples[:, 0].tolist() != list(range(25, 41)) or peer.overruns != 14:
+            problems.append(f"after a lap: {samples[:, 0].tolist()}, {peer.overruns} overruns, "
+                            f"expected 25..40 and 14")
+        peer.close()
+    finally:
+        ring.terminate()
+
+    n_samples = 3000
+    ring = SharedRing(seg, SHAREDLOCK, np.zeros(4), capacity=64)
+    done = shared_memory.SharedMemory(create=True, name=done_seg, size=8)
+    done.buf[0] = 0
+    received, torn, out_of_order = 0, 0, 0
+    try:
+        proc = mp.Process(target=_w_ring_writer, args=(seg, done_seg, n_samples))
+        proc.start()
+        cursor, last = None, -1
+        deadline = perf_counter() + JOIN_TIMEOUT
+        while perf_counter() < deadline:
+            finished = done.buf[0] == 1
+            samples, new_cursor = ring.read_since(cursor)
+            skipped = new_cursor - (cursor if cursor is not None else 0) - len(samples)
+            for sample in samples:
+                if not (sample == sample[0]).all():
+                    torn += 1
+                elif sample[0] != last + 1 and not (skipped and sample[0] > last):
+                    out_of_order += 1
+                last = sample[0]
+                skipped = 0
+            received += len(samples)
+            cursor = new_cursor
+            if finished:
+                break
+            # Slower than the writer on purpose, so the ring laps this reader and the
+            # overrun accounting runs across processes too, not only in-process.
+            sleep(0.01)
+        proc.join(timeout=max(0.1, deadline - perf_counter()))
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=2.0)
+            problems.append("the ring writer hung")
+        elif torn or out_of_order:
+            problems.append(f"{torn} torn and {out_of_order} out-of-order samples in {received}")
+        elif received + ring.overruns != n_samples + 1 or last != n_samples:
+            problems.append(f"{received} received + {ring.overruns} overrun != {n_samples + 1} written "
+                            f"(last seen {last})")
+    finally:
+        done.close()
+        done.unlink()
+        ring.terminate()
+    return problems
+
+
 def check_numpy_scalars_survive_a_real_write():
     """Every numpy scalar dtype must round-trip as its Python type (item 11, B1).
 
@@ -1015,6 +1508,9 @@ def measure_contended_writes(n_readers=3, phase_s=1.5):
             for i, key in enumerate(SERVO_KEYS):
                 local[key] = float(i)
             buf.write(local)
+            # As flush does. Without the bump, readers' generation-gated caches (item 30)
+            # would never see this phase write and would measure an idle segment.
+            owner._bump_generation()
 
         def deferred_tick():
             """The real path: BaseMinion.set_state x12, then innerLoop's flush."""
@@ -1115,12 +1611,22 @@ def measure_round_trip(iters=1000):
             peer.get("timestamp")
         out["foreign read, 1 refresh (us)"] = (perf_counter() - t0) / iters * 1e6
 
-        # get_foreign_state does `key in d.keys()` and then `d[key]`: two refreshes
+        # get_foreign_state does one `lookup` since item 31 (it used to be
+        # `key in d.keys()` and then `d[key]`: two refreshes)
         t0 = perf_counter()
         for _ in range(iters):
-            if "timestamp" in peer.keys():
-                peer["timestamp"]
+            peer.lookup("timestamp")
         out["foreign read, as framework does (us)"] = (perf_counter() - t0) / iters * 1e6
+
+        # The two rows above never see the owner write, so since item 30 they price the
+        # cache hit. This one prices the miss: the segment changes before every read.
+        total = 0.0
+        for i in range(iters):
+            owner["counter"] = i
+            t0 = perf_counter()
+            peer.get("timestamp")
+            total += perf_counter() - t0
+        out["foreign read, segment changed (us)"] = total / iters * 1e6
         peer.close()
 
         t0 = perf_counter()
@@ -1132,6 +1638,100 @@ def measure_round_trip(iters=1000):
     return out
 
 
+def measure_borrowed_reads(shape=(1080, 1920, 3), iters=50):
+    """Per-read cost of `read`, `read_into` and `borrow` on a full-HD RGB frame (item 34)."""
+    rows = []
+    for mode in ("locked", "latest"):
+        seg = f"mp_perf_borrow_{mode}"
+        _unlink_quietly(seg)
+        owner = SharedNdarray(seg, lock=SHAREDLOCK, data=np.zeros(shape, dtype=np.uint8), mode=mode)
+        peer = SharedNdarray(seg, lock=SHAREDLOCK, create=False)
+        out = np.empty(shape, dtype=np.uint8)
+        timings = {}
+        try:
+            for label, fn in (("read", peer.read),
+                              ("read_into", lambda: peer.read_into(out)),
+                              ("borrow", lambda: peer.borrow().valid)):
+                fn()
+                t0 = perf_counter()
+                for _ in range(iters):
+                    fn()
+                timings[label] = (perf_counter() - t0) / iters * 1e6
+        finally:
+            peer.close()
+            owner.terminate()
+        rows.append((mode, timings))
+    return rows
+
+
+def report_borrowed_reads(rows):
+    lines = ["Reading a 1080x1920x3 uint8 frame (us per read), item 34:",
+             f"  {'mode':<8} {'read':>9} {'read_into':>10} {'borrow':>8}"]
+    for mode, t in rows:
+        lines.append(f"  {mode:<8} {t['read']:>9.1f} {t['read_into']:>10.1f} {t['borrow']:>8.1f}")
+    return "\n".join(lines)
+
+
+def report_frame_handoff(rows):
+    lines = ["Frame handoff, 1 writer x 2 readers, 256 KB frames (item 32):",
+             f"  {'mode':<8} {'write mean':>11} {'write max':>10} {'reads':>6} {'torn':>5} {'dropped':>8}"]
+    for mode, out in rows:
+        lines.append(f"  {mode:<8} {out['write mean (us)']:>9.1f}us {out['write max (us)']:>8.1f}us"
+                     f" {out['reads']:>6} {out['torn']:>5} {out['dropped']:>8}")
+    return "\n".join(lines)
+
+
+def measure_key_lookup(key_counts=(10, 100, 1000), iters=300):
+    """One foreign single-key read after every write, full decode against directory.
+
+    Both columns pay the write-side miss, so the comparison is the decode alone: the
+    full one grows with the dict, the directory one should not. The last column is the
+    owner's side of the trade -- one publish with the directory against one without.
+    """
+    rows = []
+    for n_keys in key_counts:
+        seg = f"mp_perf_index_{n_keys}"
+        _unlink_quietly(seg)
+        owner = SharedDict(seg, lock=SHAREDLOCK, create=True, size=2 ** 17)
+        try:
+            owner.update({f"key_{i:04d}": i * 1.25 for i in range(n_keys)})
+            peer = SharedDict(seg, lock=SHAREDLOCK)
+            probe = f"key_{n_keys // 2:04d}"
+            timings = {}
+            for label, read in (("full", lambda: (peer._refresh(), dict.get(peer, probe))),
+                                ("directory", lambda: peer.lookup(probe))):
+                total = 0.0
+                for i in range(iters):
+                    owner["key_0000"] = i
+                    t0 = perf_counter()
+                    read()
+                    total += perf_counter() - t0
+                timings[label] = total / iters * 1e6
+            for label, index in (("write, indexed", True), ("write, plain", False)):
+                owner._index = index
+                t0 = perf_counter()
+                for i in range(iters):
+                    owner["key_0000"] = i
+                timings[label] = (perf_counter() - t0) / iters * 1e6
+            peer.close()
+            rows.append((n_keys, timings))
+        finally:
+            owner.close()
+            _unlink_quietly(seg)
+    return rows
+
+
+def report_key_lookup(rows):
+    lines = ["Single-key foreign read after a write (us), item 31:",
+             f"  {'keys':>6} {'full decode':>12} {'directory':>10} {'ratio':>6}"
+             f" {'write indexed':>14} {'write plain':>12}"]
+    for n_keys, t in rows:
+        lines.append(f"  {n_keys:>6} {t['full']:>12.2f} {t['directory']:>10.2f}"
+                     f" {t['full'] / t['directory']:>5.1f}x"
+                     f" {t['write, indexed']:>14.2f} {t['write, plain']:>12.2f}")
+    return "\n".join(lines)
+
+
 # --------------------------------------------------------------------------
 # pytest entry points
 # --------------------------------------------------------------------------
@@ -1181,6 +1781,31 @@ def test_generation_counter_tracks_every_write():
     assert not problems, "; ".join(problems)
 
 
+def test_generation_gates_the_read_cache():
+    problems = check_generation_gates_the_read_cache()
+    assert not problems, "; ".join(problems)
+
+
+def test_key_directory_decodes_one_value():
+    problems = check_key_directory_decodes_one_value()
+    assert not problems, "; ".join(problems)
+
+
+def test_latest_mode_never_tears_a_frame():
+    problems = check_latest_mode_never_tears_a_frame()
+    assert not problems, "; ".join(problems)
+
+
+def test_borrowed_reads_detect_overwrites():
+    problems = check_borrowed_reads_detect_overwrites()
+    assert not problems, "; ".join(problems)
+
+
+def test_ring_delivers_every_sample():
+    problems = check_ring_delivers_every_sample()
+    assert not problems, "; ".join(problems)
+
+
 def test_known_defects_still_reproduce():
     """Fails when a baseline defect stops reproducing, so the baseline cannot rot."""
     stale = []
@@ -1218,6 +1843,11 @@ if __name__ == "__main__":
          check_numpy_scalars_survive_a_real_write),
         ("generation counter tracks every write (item 14)",
          check_generation_counter_tracks_every_write),
+        ("generation gates the read cache (item 30)", check_generation_gates_the_read_cache),
+        ("key directory decodes one value (item 31)", check_key_directory_decodes_one_value),
+        ("latest mode never tears a frame (item 32)", check_latest_mode_never_tears_a_frame),
+        ("ring delivers every sample (item 33)", check_ring_delivers_every_sample),
+        ("borrowed reads detect overwrites (item 34)", check_borrowed_reads_detect_overwrites),
     ):
         problems = fn()
         if problems:
@@ -1251,6 +1881,15 @@ if __name__ == "__main__":
             unit = "" if k.endswith("(s)") else ""
             print(f"  {k:<40} {v:8.2f}{unit}")
 
+        print()
+        print(report_key_lookup(measure_key_lookup()))
+
+        print()
+        print(report_frame_handoff([(mode, run_frame_handoff(mode)) for mode in ("locked", "latest")]))
+
+        print()
+        print(report_borrowed_reads(measure_borrowed_reads()))
+
         print()
         print(report_contended_writes(measure_contended_writes()))
 